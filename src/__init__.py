@@ -1,2 +1,2 @@
-# Market Session Trading Bot
+# Market Session Trading Bot
 __version__ = "1.0.0" 
\ No newline at end of file
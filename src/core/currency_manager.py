@@ -1,402 +1,527 @@
-"""
-Multi-currency pair manager for handling multiple trading instruments.
-"""
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Set, Tuple, Optional, Any
-from datetime import datetime, timedelta
-from loguru import logger
-from dataclasses import dataclass
-
-from src.core.config import SessionType
-
-
-@dataclass
-class CurrencyPair:
-    """Represents a currency pair with its properties."""
-    symbol: str
-    base_currency: str
-    quote_currency: str
-    pip_value: float
-    min_lot: float
-    max_lot: float
-    lot_step: float
-    spread: float
-    commission: float
-    swap_long: float
-    swap_short: float
-    session_preference: List[SessionType]
-    volatility_profile: Dict[str, float]
-    correlation_groups: List[str]
-
-
-class CurrencyManager:
-    """Manages multiple currency pairs with correlation and risk analysis."""
-    
-    def __init__(self):
-        self.pairs: Dict[str, CurrencyPair] = {}
-        self.correlation_matrix: pd.DataFrame = None
-        self.active_pairs: Set[str] = set()
-        self.max_correlated_pairs = 3
-        self.correlation_threshold = 0.7
-        
-        # Initialize default currency pairs
-        self._initialize_default_pairs()
-    
-    def _initialize_default_pairs(self):
-        """Initialize default currency pairs with their properties."""
-        default_pairs = [
-            # Major pairs
-            CurrencyPair(
-                symbol="EURUSD",
-                base_currency="EUR",
-                quote_currency="USD",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.0,
-                commission=0.0,
-                swap_long=-2.0,
-                swap_short=1.0,
-                session_preference=[SessionType.LONDON, SessionType.NEW_YORK],
-                volatility_profile={"asian": 0.3, "london": 0.8, "new_york": 0.9},
-                correlation_groups=["majors", "eur_pairs"]
-            ),
-            CurrencyPair(
-                symbol="GBPUSD",
-                base_currency="GBP",
-                quote_currency="USD",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.5,
-                commission=0.0,
-                swap_long=-3.0,
-                swap_short=1.5,
-                session_preference=[SessionType.LONDON, SessionType.NEW_YORK],
-                volatility_profile={"asian": 0.2, "london": 0.9, "new_york": 0.8},
-                correlation_groups=["majors", "gbp_pairs"]
-            ),
-            CurrencyPair(
-                symbol="USDJPY",
-                base_currency="USD",
-                quote_currency="JPY",
-                pip_value=0.01,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.2,
-                commission=0.0,
-                swap_long=1.0,
-                swap_short=-2.0,
-                session_preference=[SessionType.ASIAN, SessionType.LONDON],
-                volatility_profile={"asian": 0.7, "london": 0.6, "new_york": 0.5},
-                correlation_groups=["majors", "jpy_pairs"]
-            ),
-            CurrencyPair(
-                symbol="AUDUSD",
-                base_currency="AUD",
-                quote_currency="USD",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.3,
-                commission=0.0,
-                swap_long=-1.5,
-                swap_short=0.8,
-                session_preference=[SessionType.ASIAN, SessionType.LONDON],
-                volatility_profile={"asian": 0.8, "london": 0.5, "new_york": 0.4},
-                correlation_groups=["commodity", "aud_pairs"]
-            ),
-            CurrencyPair(
-                symbol="USDCAD",
-                base_currency="USD",
-                quote_currency="CAD",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.4,
-                commission=0.0,
-                swap_long=0.5,
-                swap_short=-1.0,
-                session_preference=[SessionType.NEW_YORK, SessionType.LONDON],
-                volatility_profile={"asian": 0.2, "london": 0.4, "new_york": 0.7},
-                correlation_groups=["commodity", "cad_pairs"]
-            ),
-            CurrencyPair(
-                symbol="NZDUSD",
-                base_currency="NZD",
-                quote_currency="USD",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.6,
-                commission=0.0,
-                swap_long=-2.0,
-                swap_short=1.0,
-                session_preference=[SessionType.ASIAN, SessionType.LONDON],
-                volatility_profile={"asian": 0.6, "london": 0.4, "new_york": 0.3},
-                correlation_groups=["commodity", "nzd_pairs"]
-            ),
-            # Minor pairs
-            CurrencyPair(
-                symbol="EURGBP",
-                base_currency="EUR",
-                quote_currency="GBP",
-                pip_value=0.0001,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=2.0,
-                commission=0.0,
-                swap_long=-1.0,
-                swap_short=0.5,
-                session_preference=[SessionType.LONDON],
-                volatility_profile={"asian": 0.1, "london": 0.6, "new_york": 0.3},
-                correlation_groups=["crosses", "eur_pairs", "gbp_pairs"]
-            ),
-            CurrencyPair(
-                symbol="EURJPY",
-                base_currency="EUR",
-                quote_currency="JPY",
-                pip_value=0.01,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=1.8,
-                commission=0.0,
-                swap_long=-1.5,
-                swap_short=1.0,
-                session_preference=[SessionType.ASIAN, SessionType.LONDON],
-                volatility_profile={"asian": 0.8, "london": 0.7, "new_york": 0.5},
-                correlation_groups=["crosses", "eur_pairs", "jpy_pairs"]
-            ),
-            CurrencyPair(
-                symbol="GBPJPY",
-                base_currency="GBP",
-                quote_currency="JPY",
-                pip_value=0.01,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=2.2,
-                commission=0.0,
-                swap_long=-2.5,
-                swap_short=1.5,
-                session_preference=[SessionType.ASIAN, SessionType.LONDON],
-                volatility_profile={"asian": 0.9, "london": 0.8, "new_york": 0.6},
-                correlation_groups=["crosses", "gbp_pairs", "jpy_pairs"]
-            ),
-            CurrencyPair(
-                symbol="AUDJPY",
-                base_currency="AUD",
-                quote_currency="JPY",
-                pip_value=0.01,
-                min_lot=0.01,
-                max_lot=100.0,
-                lot_step=0.01,
-                spread=2.0,
-                commission=0.0,
-                swap_long=-1.0,
-                swap_short=0.8,
-                session_preference=[SessionType.ASIAN],
-                volatility_profile={"asian": 0.9, "london": 0.5, "new_york": 0.3},
-                correlation_groups=["commodity", "aud_pairs", "jpy_pairs"]
-            )
-        ]
-        
-        for pair in default_pairs:
-            self.pairs[pair.symbol] = pair
-    
-    def add_pair(self, pair: CurrencyPair):
-        """Add a new currency pair."""
-        self.pairs[pair.symbol] = pair
-        logger.info(f"Added currency pair: {pair.symbol}")
-    
-    def remove_pair(self, symbol: str):
-        """Remove a currency pair."""
-        if symbol in self.pairs:
-            del self.pairs[symbol]
-            self.active_pairs.discard(symbol)
-            logger.info(f"Removed currency pair: {symbol}")
-    
-    def get_pairs_for_session(self, session_type: SessionType) -> List[str]:
-        """Get currency pairs suitable for a specific session."""
-        suitable_pairs = []
-        
-        for symbol, pair in self.pairs.items():
-            if session_type in pair.session_preference:
-                suitable_pairs.append(symbol)
-        
-        return suitable_pairs
-    
-    def get_pairs_by_volatility(self, session_type: SessionType, 
-                               min_volatility: float = 0.0) -> List[str]:
-        """Get currency pairs with minimum volatility for a session."""
-        session_name = session_type.value
-        suitable_pairs = []
-        
-        for symbol, pair in self.pairs.items():
-            volatility = pair.volatility_profile.get(session_name, 0.0)
-            if volatility >= min_volatility:
-                suitable_pairs.append(symbol)
-        
-        return suitable_pairs
-    
-    def get_correlated_pairs(self, symbol: str, threshold: float = None) -> List[str]:
-        """Get pairs correlated with the given symbol."""
-        if threshold is None:
-            threshold = self.correlation_threshold
-        
-        if self.correlation_matrix is None:
-            return []
-        
-        if symbol not in self.correlation_matrix.index:
-            return []
-        
-        correlations = self.correlation_matrix[symbol].abs()
-        correlated = correlations[correlations > threshold].index.tolist()
-        correlated.remove(symbol)  # Remove self-correlation
-        
-        return correlated
-    
-    def update_correlation_matrix(self, price_data: Dict[str, pd.DataFrame]):
-        """Update correlation matrix based on price data."""
-        try:
-            # Prepare price data for correlation calculation
-            returns_data = {}
-            
-            for symbol, data in price_data.items():
-                if not data.empty and 'close' in data.columns:
-                    returns = data['close'].pct_change().dropna()
-                    if len(returns) > 30:  # Minimum data requirement
-                        returns_data[symbol] = returns
-            
-            if len(returns_data) < 2:
-                logger.warning("Insufficient data for correlation calculation")
-                return
-            
-            # Create returns dataframe
-            returns_df = pd.DataFrame(returns_data)
-            
-            # Calculate correlation matrix
-            self.correlation_matrix = returns_df.corr()
-            
-            logger.info(f"Updated correlation matrix for {len(returns_data)} pairs")
-            
-        except Exception as e:
-            logger.error(f"Error updating correlation matrix: {e}")
-    
-    def can_open_position(self, symbol: str, current_positions: List[str]) -> Tuple[bool, str]:
-        """Check if a new position can be opened considering correlations."""
-        if symbol not in self.pairs:
-            return False, "Symbol not found"
-        
-        # Check correlation limits
-        correlated_pairs = self.get_correlated_pairs(symbol)
-        correlated_positions = [pos for pos in current_positions if pos in correlated_pairs]
-        
-        if len(correlated_positions) >= self.max_correlated_pairs:
-            return False, f"Too many correlated positions: {correlated_positions}"
-        
-        return True, "Position can be opened"
-    
-    def get_optimal_pairs(self, session_type: SessionType, 
-                         max_pairs: int = 5) -> List[str]:
-        """Get optimal currency pairs for a session."""
-        # Get suitable pairs for the session
-        suitable_pairs = self.get_pairs_for_session(session_type)
-        
-        if len(suitable_pairs) <= max_pairs:
-            return suitable_pairs
-        
-        # Sort by volatility for the session
-        session_name = session_type.value
-        pair_volatilities = []
-        
-        for symbol in suitable_pairs:
-            pair = self.pairs[symbol]
-            volatility = pair.volatility_profile.get(session_name, 0.0)
-            pair_volatilities.append((symbol, volatility))
-        
-        # Sort by volatility (descending) and return top pairs
-        pair_volatilities.sort(key=lambda x: x[1], reverse=True)
-        return [pair[0] for pair in pair_volatilities[:max_pairs]]
-    
-    def get_pair_info(self, symbol: str) -> Optional[CurrencyPair]:
-        """Get information about a currency pair."""
-        return self.pairs.get(symbol)
-    
-    def get_all_pairs(self) -> List[str]:
-        """Get all available currency pairs."""
-        return list(self.pairs.keys())
-    
-    def get_pairs_by_group(self, group: str) -> List[str]:
-        """Get currency pairs by correlation group."""
-        pairs = []
-        for symbol, pair in self.pairs.items():
-            if group in pair.correlation_groups:
-                pairs.append(symbol)
-        return pairs
-    
-    def calculate_position_size(self, symbol: str, risk_amount: float, 
-                              stop_loss_pips: float) -> float:
-        """Calculate position size for a currency pair."""
-        pair = self.pairs.get(symbol)
-        if not pair:
-            return 0.0
-        
-        # Calculate position size based on pip value and stop loss
-        risk_per_lot = stop_loss_pips * pair.pip_value
-        if risk_per_lot <= 0:
-            return 0.0
-        
-        position_size = risk_amount / risk_per_lot
-        
-        # Apply pair-specific limits
-        position_size = max(pair.min_lot, min(pair.max_lot, position_size))
-        
-        # Round to lot step
-        position_size = round(position_size / pair.lot_step) * pair.lot_step
-        
-        return position_size
-    
-    def get_session_volatility(self, symbol: str, session_type: SessionType) -> float:
-        """Get volatility profile for a pair in a specific session."""
-        pair = self.pairs.get(symbol)
-        if not pair:
-            return 0.0
-        
-        session_name = session_type.value
-        return pair.volatility_profile.get(session_name, 0.0)
-    
-    def get_correlation_summary(self) -> Dict[str, Any]:
-        """Get summary of correlation analysis."""
-        if self.correlation_matrix is None:
-            return {"error": "No correlation data available"}
-        
-        summary = {
-            "total_pairs": len(self.correlation_matrix),
-            "high_correlations": 0,
-            "correlation_groups": {}
-        }
-        
-        # Count high correlations
-        high_corr_mask = self.correlation_matrix.abs() > self.correlation_threshold
-        summary["high_correlations"] = high_corr_mask.sum().sum() - len(self.correlation_matrix)
-        
-        # Group correlations by currency
-        for symbol in self.correlation_matrix.index:
-            pair = self.pairs.get(symbol)
-            if pair:
-                for group in pair.correlation_groups:
-                    if group not in summary["correlation_groups"]:
-                        summary["correlation_groups"][group] = []
-                    summary["correlation_groups"][group].append(symbol)
-        
-        return summary 
\ No newline at end of file
+"""
+Multi-currency pair manager for handling multiple trading instruments.
+"""
+import sys
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple, Optional, Any
+from datetime import datetime, timedelta
+from loguru import logger
+from dataclasses import dataclass, field
+
+from src.core.config import SessionType
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _compute_corr(returns: np.ndarray) -> np.ndarray:
+    """Pearson correlation of the columns of a (bars x pairs) returns array."""
+    # z-score each column, then one matmul gives the correlation matrix. NumPy hands a
+    # product of an array with its own transpose to BLAS syrk, which computes one triangle
+    # and mirrors it, so the symmetric pairs are never computed twice
+    z = returns - returns.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z /= z.std(axis=0, ddof=1)
+    correlations = (z.T @ z) / (len(z) - 1)
+    return np.clip(correlations, -1.0, 1.0, out=correlations)
+
+
+# dataclass(slots=...) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class CurrencyPair:
+    """Represents an immutable currency pair with its properties."""
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    pip_value: float
+    min_lot: float
+    max_lot: float
+    lot_step: float
+    spread: float
+    commission: float
+    swap_long: float
+    swap_short: float
+    session_preference: Tuple[SessionType, ...]
+    volatility_profile: Dict[str, float] = field(hash=False)
+    correlation_groups: Tuple[str, ...]
+    
+    def __post_init__(self):
+        # Freeze the container fields so the pair is safe to share and hash; the profile
+        # stays a plain dict so the pair can be pickled and deep-copied
+        object.__setattr__(self, 'session_preference', tuple(self.session_preference))
+        object.__setattr__(self, 'volatility_profile', dict(self.volatility_profile))
+        object.__setattr__(self, 'correlation_groups', tuple(self.correlation_groups))
+
+
+# Default pairs: symbol, pip value, spread, swap long, swap short,
+# preferred sessions, (asian, london, new_york) volatility, correlation groups
+_ASIAN, _LONDON, _NEW_YORK = SessionType.ASIAN, SessionType.LONDON, SessionType.NEW_YORK
+_DEFAULT_VOLATILITY_SESSIONS = ("asian", "london", "new_york")
+_DEFAULT_PAIRS: Tuple[tuple, ...] = (
+    # Major pairs
+    ("EURUSD", 0.0001, 1.0, -2.0, 1.0, (_LONDON, _NEW_YORK), (0.3, 0.8, 0.9), ("majors", "eur_pairs")),
+    ("GBPUSD", 0.0001, 1.5, -3.0, 1.5, (_LONDON, _NEW_YORK), (0.2, 0.9, 0.8), ("majors", "gbp_pairs")),
+    ("USDJPY", 0.01, 1.2, 1.0, -2.0, (_ASIAN, _LONDON), (0.7, 0.6, 0.5), ("majors", "jpy_pairs")),
+    ("AUDUSD", 0.0001, 1.3, -1.5, 0.8, (_ASIAN, _LONDON), (0.8, 0.5, 0.4), ("commodity", "aud_pairs")),
+    ("USDCAD", 0.0001, 1.4, 0.5, -1.0, (_NEW_YORK, _LONDON), (0.2, 0.4, 0.7), ("commodity", "cad_pairs")),
+    ("NZDUSD", 0.0001, 1.6, -2.0, 1.0, (_ASIAN, _LONDON), (0.6, 0.4, 0.3), ("commodity", "nzd_pairs")),
+    # Minor pairs
+    ("EURGBP", 0.0001, 2.0, -1.0, 0.5, (_LONDON,), (0.1, 0.6, 0.3), ("crosses", "eur_pairs", "gbp_pairs")),
+    ("EURJPY", 0.01, 1.8, -1.5, 1.0, (_ASIAN, _LONDON), (0.8, 0.7, 0.5), ("crosses", "eur_pairs", "jpy_pairs")),
+    ("GBPJPY", 0.01, 2.2, -2.5, 1.5, (_ASIAN, _LONDON), (0.9, 0.8, 0.6), ("crosses", "gbp_pairs", "jpy_pairs")),
+    ("AUDJPY", 0.01, 2.0, -1.0, 0.8, (_ASIAN,), (0.9, 0.5, 0.3), ("commodity", "aud_pairs", "jpy_pairs")),
+)
+
+
+class CurrencyManager:
+    """Manages multiple currency pairs with correlation and risk analysis."""
+    
+    # Column of each session in the volatility matrix
+    SESSION_INDEX: Dict[SessionType, int] = {s: i for i, s in enumerate(SessionType)}
+    
+    def __init__(self):
+        self.pairs: Dict[str, CurrencyPair] = {}
+        self.correlation_matrix: Optional["pd.DataFrame"] = None
+        self._corr_values: Optional[np.ndarray] = None
+        self._corr_symbols = np.empty(0, dtype=object)
+        self._corr_index: Dict[str, int] = {}
+        self._correlated_sets: Dict[str, frozenset] = {}
+        # The same relation as bitmasks over the correlation matrix's symbol order
+        self._corr_bits: Dict[str, int] = {}
+        self._correlated_masks: Dict[str, int] = {}
+        self._correlated_sets_threshold: Optional[float] = None
+        self._corr_version = 0
+        
+        # Rolling window of returns behind the correlations and its running sums;
+        # new bars overwrite the oldest slot
+        self._sum1: Optional[np.ndarray] = None
+        self._sum2: Optional[np.ndarray] = None
+        self._n = 0
+        self._window: Optional[np.ndarray] = None
+        self._window_pos = 0
+        # Time and log closes of the newest bar in the window
+        self.correlation_last_bar: Optional["pd.Timestamp"] = None
+        self._last_log_closes: Optional[np.ndarray] = None
+        self._summary_cache: Optional[Tuple[Tuple[int, float], Dict[str, Any]]] = None
+        self._optimal_cache: Dict[Tuple[SessionType, int], Tuple[str, ...]] = {}
+        self.active_pairs: Set[str] = set()
+        self.max_correlated_pairs = 3
+        self.correlation_threshold = 0.7
+        
+        # Column-oriented copies of the pair attributes for vectorized queries
+        self._sym_index: Dict[str, int] = {}
+        self._symbols = np.empty(0, dtype=object)
+        self._pip_value = np.empty(0)
+        self._min_lot = np.empty(0)
+        self._max_lot = np.empty(0)
+        self._lot_step = np.empty(0)
+        self._vol_matrix = np.empty((0, len(self.SESSION_INDEX)))
+        
+        # Inverted indexes: session / correlation group -> symbols
+        self._session_to_symbols: Dict[SessionType, List[str]] = {}
+        self._group_to_symbols: Dict[str, List[str]] = {}
+        
+        # Initialize default currency pairs
+        self._initialize_default_pairs()
+    
+    def _initialize_default_pairs(self):
+        """Initialize default currency pairs with their properties."""
+        for symbol, pip_value, spread, swap_long, swap_short, sessions, volatility, groups in _DEFAULT_PAIRS:
+            self.pairs[symbol] = CurrencyPair(
+                symbol=symbol,
+                base_currency=symbol[:3],
+                quote_currency=symbol[3:],
+                pip_value=pip_value,
+                min_lot=0.01,
+                max_lot=100.0,
+                lot_step=0.01,
+                spread=spread,
+                commission=0.0,
+                swap_long=swap_long,
+                swap_short=swap_short,
+                session_preference=sessions,
+                volatility_profile=dict(zip(_DEFAULT_VOLATILITY_SESSIONS, volatility)),
+                correlation_groups=groups
+            )
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """Rebuild the per-attribute arrays and lookup indexes from the pairs dict."""
+        self._summary_cache = None
+        self._optimal_cache = {}
+        pairs = list(self.pairs.values())
+        self._sym_index = {pair.symbol: i for i, pair in enumerate(pairs)}
+        self._symbols = np.array([pair.symbol for pair in pairs], dtype=object)
+        self._pip_value = np.array([pair.pip_value for pair in pairs], dtype=np.float64)
+        self._min_lot = np.array([pair.min_lot for pair in pairs], dtype=np.float64)
+        self._max_lot = np.array([pair.max_lot for pair in pairs], dtype=np.float64)
+        self._lot_step = np.array([pair.lot_step for pair in pairs], dtype=np.float64)
+        
+        self._vol_matrix = np.array(
+            [[pair.volatility_profile.get(s.value, 0.0) for s in self.SESSION_INDEX] for pair in pairs],
+            dtype=np.float64,
+        ).reshape(len(pairs), len(self.SESSION_INDEX))
+        
+        self._session_to_symbols = {}
+        self._group_to_symbols = {}
+        for pair in pairs:
+            for session_type in pair.session_preference:
+                self._session_to_symbols.setdefault(session_type, []).append(pair.symbol)
+            for group in pair.correlation_groups:
+                self._group_to_symbols.setdefault(group, []).append(pair.symbol)
+    
+    def add_pair(self, pair: CurrencyPair):
+        """Add a new currency pair."""
+        self.pairs[pair.symbol] = pair
+        self._rebuild_indexes()
+        logger.info(f"Added currency pair: {pair.symbol}")
+    
+    def remove_pair(self, symbol: str):
+        """Remove a currency pair."""
+        if symbol in self.pairs:
+            del self.pairs[symbol]
+            self.active_pairs.discard(symbol)
+            self._rebuild_indexes()
+            logger.info(f"Removed currency pair: {symbol}")
+    
+    def get_pairs_for_session(self, session_type: SessionType) -> List[str]:
+        """Get currency pairs suitable for a specific session."""
+        return list(self._session_to_symbols.get(session_type, ()))
+    
+    def get_pairs_by_volatility(self, session_type: SessionType, 
+                               min_volatility: float = 0.0) -> List[str]:
+        """Get currency pairs with minimum volatility for a session."""
+        col = self.SESSION_INDEX[session_type]
+        return self._symbols[self._vol_matrix[:, col] >= min_volatility].tolist()
+    
+    def get_correlated_pairs(self, symbol: str, threshold: float = None) -> List[str]:
+        """Get pairs correlated with the given symbol."""
+        if threshold is None:
+            threshold = self.correlation_threshold
+        
+        i = self._corr_index.get(symbol)
+        if i is None:
+            return []
+        
+        mask = np.abs(self._corr_values[i]) > threshold
+        mask[i] = False  # Remove self-correlation
+        
+        return self._corr_symbols[mask].tolist()
+    
+    def update_correlation_matrix(self, price_data: Dict[str, "pd.DataFrame"]):
+        """Update correlation matrix based on price data."""
+        import pandas as pd
+        
+        # Collect numeric close prices (31+ bars gives the 30 returns minimum)
+        closes_data = {}
+        for symbol, data in price_data.items():
+            if not isinstance(data, pd.DataFrame) or 'close' not in data.columns:
+                logger.warning(f"No close prices for {symbol}, skipping correlation")
+                continue
+            if not pd.api.types.is_numeric_dtype(data['close']):
+                logger.warning(f"Non-numeric close prices for {symbol}, skipping correlation")
+                continue
+            if len(data) > 31:
+                closes_data[symbol] = data['close']
+        
+        if len(closes_data) < 2:
+            logger.warning("Insufficient data for correlation calculation")
+            return
+        
+        # Stack closes on the timestamps all pairs share
+        closes_df = pd.concat(closes_data, axis=1).dropna()
+        closes = closes_df.to_numpy(dtype=np.float64)
+        if len(closes) <= 31:
+            logger.warning("Insufficient overlapping data for correlation calculation")
+            return
+        
+        # Log returns for every pair in one pass
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(np.log(closes), axis=0)
+        returns = returns[np.isfinite(returns).all(axis=1)]
+        
+        if len(returns) <= 30:
+            logger.warning("Insufficient overlapping data for correlation calculation")
+            return
+        
+        # Seed the window and its running sums so later bars can be folded in incrementally
+        self._window = returns
+        self._window_pos = 0
+        self._sum1 = returns.sum(axis=0)
+        self._sum2 = returns.T @ returns
+        self._n = len(returns)
+        self.correlation_last_bar = closes_df.index[-1]
+        self._last_log_closes = np.log(closes[-1])
+        
+        self._set_correlation(closes_df.columns, _compute_corr(returns.astype(np.float32)))
+        
+        logger.info(f"Updated correlation matrix for {len(closes_data)} pairs")
+    
+    def append_bars(self, price_data: Dict[str, "pd.DataFrame"]) -> int:
+        """Slide the correlation window over bars newer than the last one folded in.
+        
+        Only timestamps with a close for every correlated pair are used. Returns the number
+        of bars added.
+        """
+        import pandas as pd
+        
+        if self._window is None:
+            logger.warning("Correlation matrix not initialized, cannot append bars")
+            return 0
+        
+        symbols = self._corr_symbols.tolist()
+        if any(symbol not in price_data for symbol in symbols):
+            return 0
+        
+        closes_df = pd.concat({symbol: price_data[symbol]['close'] for symbol in symbols}, axis=1).dropna()
+        closes_df = closes_df[closes_df.index > self.correlation_last_bar]
+        if closes_df.empty:
+            return 0
+        
+        # Log returns chained on from the last close already in the window
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_closes = np.log(closes_df.to_numpy(dtype=np.float64))
+        returns = np.diff(log_closes, axis=0, prepend=self._last_log_closes[np.newaxis, :])
+        added = sum(self._slide_window(row) for row in returns)
+        
+        self.correlation_last_bar = closes_df.index[-1]
+        self._last_log_closes = log_closes[-1]
+        if added:
+            self._publish_window_correlation()
+        return added
+    
+    def ingest_bar(self, returns_row: np.ndarray):
+        """Slide the correlation window forward by one bar of log returns (in correlation matrix order)."""
+        if self._window is None:
+            logger.warning("Correlation matrix not initialized, cannot ingest bar")
+            return
+        
+        if self._slide_window(returns_row):
+            self._publish_window_correlation()
+    
+    def _slide_window(self, returns_row: np.ndarray) -> bool:
+        """Replace the oldest bar of the window, updating the running sums."""
+        row = np.asarray(returns_row, dtype=np.float64)
+        if row.shape != self._sum1.shape or not np.isfinite(row).all():
+            logger.warning("Invalid returns row for correlation update")
+            return False
+        
+        pos = self._window_pos
+        oldest = self._window[pos]
+        self._sum1 += row - oldest
+        self._sum2 += np.outer(row, row)
+        self._sum2 -= np.outer(oldest, oldest)
+        self._window[pos] = row
+        self._window_pos = (pos + 1) % self._n
+        
+        if self._window_pos == 0:
+            # Re-derive the sums once per full turn so rounding errors cannot build up
+            self._sum1 = self._window.sum(axis=0)
+            self._sum2 = self._window.T @ self._window
+        return True
+    
+    def _publish_window_correlation(self):
+        """Publish the correlations of the current window from its running sums."""
+        # Covariance and correlation straight from the running sums
+        n = self._n
+        cov = (self._sum2 - np.outer(self._sum1, self._sum1) / n) / (n - 1)
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlations = cov / np.outer(std, std)
+        np.clip(correlations, -1.0, 1.0, out=correlations)
+        
+        self._set_correlation(self._corr_symbols, correlations.astype(np.float32))
+    
+    def _set_correlation(self, symbols, correlations: np.ndarray):
+        """Publish a new correlation matrix and refresh the derived lookups."""
+        import pandas as pd
+        
+        self.correlation_matrix = pd.DataFrame(correlations, index=symbols, columns=symbols)
+        self._corr_values = correlations
+        self._corr_symbols = np.array(symbols, dtype=object)
+        self._corr_index = {symbol: i for i, symbol in enumerate(self._corr_symbols)}
+        self._corr_bits = {symbol: 1 << i for symbol, i in self._corr_index.items()}
+        self._build_correlated_sets()
+        self._corr_version += 1
+    
+    def _build_correlated_sets(self):
+        """Precompute the set of pairs correlated with each symbol."""
+        threshold = self.correlation_threshold
+        high_corr = np.abs(self._corr_values) > threshold
+        np.fill_diagonal(high_corr, False)
+        self._correlated_sets = {
+            symbol: frozenset(self._corr_symbols[high_corr[i]].tolist())
+            for i, symbol in enumerate(self._corr_symbols)
+        }
+        self._correlated_masks = {
+            symbol: sum(1 << j for j in np.flatnonzero(high_corr[i]).tolist())
+            for i, symbol in enumerate(self._corr_symbols)
+        }
+        self._correlated_sets_threshold = threshold
+    
+    def position_mask(self, symbols: Iterable[str]) -> int:
+        """Bitmask of the symbols holding positions, for can_open_with_mask."""
+        mask = 0
+        for symbol in symbols:
+            mask |= self._corr_bits.get(symbol, 0)
+        return mask
+    
+    def can_open_position(self, symbol: str, current_positions: List[str]) -> Tuple[bool, str]:
+        """Check if a new position can be opened considering correlations."""
+        return self.can_open_with_mask(symbol, self.position_mask(current_positions))
+    
+    def can_open_with_mask(self, symbol: str, position_mask: int) -> Tuple[bool, str]:
+        """Check if a new position can be opened, given the position_mask of the open positions."""
+        if symbol not in self.pairs:
+            return False, "Symbol not found"
+        
+        # Check correlation limits
+        if self._corr_values is not None and self._correlated_sets_threshold != self.correlation_threshold:
+            self._build_correlated_sets()
+        correlated = self._correlated_masks.get(symbol, 0) & position_mask
+        
+        if correlated and bin(correlated).count("1") >= self.max_correlated_pairs:
+            correlated_positions = [pos for pos, bit in self._corr_bits.items() if correlated & bit]
+            return False, f"Too many correlated positions: {correlated_positions}"
+        
+        return True, "Position can be opened"
+    
+    def get_optimal_pairs(self, session_type: SessionType, 
+                         max_pairs: int = 5) -> List[str]:
+        """Get optimal currency pairs for a session."""
+        # Pair volatilities only change on add/remove, which clear the cache
+        key = (session_type, max_pairs)
+        optimal = self._optimal_cache.get(key)
+        if optimal is None:
+            optimal = self._optimal_cache[key] = self._select_optimal_pairs(session_type, max_pairs)
+        return list(optimal)
+    
+    def _select_optimal_pairs(self, session_type: SessionType, max_pairs: int) -> Tuple[str, ...]:
+        """Select the most volatile pairs suitable for a session."""
+        # Get suitable pairs for the session
+        suitable_pairs = self._session_to_symbols.get(session_type, [])
+        
+        if len(suitable_pairs) <= max_pairs:
+            return tuple(suitable_pairs)
+        
+        if max_pairs <= 0:
+            return ()
+        
+        rows = np.fromiter((self._sym_index[s] for s in suitable_pairs),
+                           dtype=np.intp, count=len(suitable_pairs))
+        volatilities = self._vol_matrix[rows, self.SESSION_INDEX[session_type]]
+        
+        # Select the top pairs by volatility without a full sort; ties at the
+        # cut-off keep their original order
+        kth = np.partition(volatilities, len(volatilities) - max_pairs)[len(volatilities) - max_pairs]
+        above = np.flatnonzero(volatilities > kth)
+        tied = np.flatnonzero(volatilities == kth)[:max_pairs - len(above)]
+        top = np.sort(np.concatenate((above, tied)))
+        top = top[np.argsort(-volatilities[top], kind='stable')]
+        return tuple(self._symbols[rows[top]].tolist())
+    
+    def get_pair_info(self, symbol: str) -> Optional[CurrencyPair]:
+        """Get information about a currency pair."""
+        return self.pairs.get(symbol)
+    
+    def get_all_pairs(self) -> List[str]:
+        """Get all available currency pairs."""
+        return list(self.pairs.keys())
+    
+    def get_pairs_by_group(self, group: str) -> List[str]:
+        """Get currency pairs by correlation group."""
+        return list(self._group_to_symbols.get(group, ()))
+    
+    def calculate_position_size(self, symbol: str, risk_amount: float, 
+                              stop_loss_pips: float) -> float:
+        """Calculate position size for a currency pair."""
+        i = self._sym_index.get(symbol)
+        if i is None:
+            return 0.0
+        
+        # Calculate position size based on pip value and stop loss
+        risk_per_lot = stop_loss_pips * float(self._pip_value[i])
+        if risk_per_lot <= 0:
+            return 0.0
+        
+        position_size = risk_amount / risk_per_lot
+        
+        # Apply pair-specific limits
+        position_size = max(float(self._min_lot[i]), min(float(self._max_lot[i]), position_size))
+        
+        # Round to lot step
+        lot_step = float(self._lot_step[i])
+        position_size = round(position_size / lot_step) * lot_step
+        
+        return position_size
+    
+    def calculate_position_sizes(self, symbols: List[str], risk_amounts,
+                                 stop_loss_pips) -> np.ndarray:
+        """Calculate position sizes for several symbols at once."""
+        rows = np.fromiter((self._sym_index.get(s, -1) for s in symbols),
+                           dtype=np.intp, count=len(symbols))
+        known = rows >= 0
+        rows = np.where(known, rows, 0)
+        risk_amounts = np.broadcast_to(np.asarray(risk_amounts, dtype=np.float64), rows.shape)
+        stop_loss_pips = np.broadcast_to(np.asarray(stop_loss_pips, dtype=np.float64), rows.shape)
+        
+        # Calculate position sizes based on pip value and stop loss
+        risk_per_lot = stop_loss_pips * self._pip_value[rows]
+        valid = known & (risk_per_lot > 0)
+        sizes = np.divide(risk_amounts, risk_per_lot, out=np.zeros(rows.shape), where=valid)
+        
+        # Apply pair-specific limits and round to lot step
+        lot_step = self._lot_step[rows]
+        sizes = np.clip(sizes, self._min_lot[rows], self._max_lot[rows])
+        sizes = np.round(sizes / lot_step) * lot_step
+        
+        return np.where(valid, sizes, 0.0)
+    
+    def get_session_volatility(self, symbol: str, session_type: SessionType) -> float:
+        """Get volatility profile for a pair in a specific session."""
+        i = self._sym_index.get(symbol)
+        if i is None:
+            return 0.0
+        
+        return float(self._vol_matrix[i, self.SESSION_INDEX[session_type]])
+    
+    def get_correlation_summary(self) -> Dict[str, Any]:
+        """Get summary of correlation analysis."""
+        if self.correlation_matrix is None:
+            return {"error": "No correlation data available"}
+        
+        cache_key = (self._corr_version, self.correlation_threshold)
+        if self._summary_cache is not None and self._summary_cache[0] == cache_key:
+            return self._copy_summary(self._summary_cache[1])
+        
+        summary = {
+            "total_pairs": len(self.correlation_matrix),
+            "high_correlations": 0,
+            "correlation_groups": {}
+        }
+        
+        # Count high correlations (excluding the diagonal)
+        high_count = np.count_nonzero(np.abs(self._corr_values) > self.correlation_threshold)
+        summary["high_correlations"] = high_count - len(self._corr_values)
+        
+        # Group correlations by currency
+        for symbol in self.correlation_matrix.index:
+            pair = self.pairs.get(symbol)
+            if pair:
+                for group in pair.correlation_groups:
+                    if group not in summary["correlation_groups"]:
+                        summary["correlation_groups"][group] = []
+                    summary["correlation_groups"][group].append(symbol)
+        
+        self._summary_cache = (cache_key, summary)
+        return self._copy_summary(summary)
+    
+    @staticmethod
+    def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached summary, down to the group lists, so callers cannot alter the cache."""
+        summary_copy = dict(summary)
+        summary_copy["correlation_groups"] = {group: list(symbols) for group, symbols in summary["correlation_groups"].items()}
+        return summary_copy
\ No newline at end of file
@@ -1,902 +1,1615 @@
-"""
-Comprehensive profit monitoring system for trading bot.
-"""
-import pandas as pd
-import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from loguru import logger
-import json
-import os
-from pathlib import Path
-
-from src.core.config import SessionType
-
-
-@dataclass
-class TradeRecord:
-    """Record of a single trade."""
-    ticket: int
-    symbol: str
-    order_type: str
-    volume: float
-    open_price: float
-    close_price: Optional[float]
-    open_time: datetime
-    close_time: Optional[datetime]
-    profit: float
-    swap: float
-    commission: float
-    session: SessionType
-    strategy: str
-    stop_loss: Optional[float]
-    take_profit: Optional[float]
-    exit_reason: Optional[str]
-
-
-@dataclass
-class PerformanceMetrics:
-    """Performance metrics for a trading period."""
-    total_trades: int
-    winning_trades: int
-    losing_trades: int
-    win_rate: float
-    total_profit: float
-    total_loss: float
-    net_profit: float
-    profit_factor: float
-    average_win: float
-    average_loss: float
-    largest_win: float
-    largest_loss: float
-    max_drawdown: float
-    sharpe_ratio: float
-    sortino_ratio: float
-    calmar_ratio: float
-    total_volume: float
-    average_trade_duration: timedelta
-
-
-@dataclass
-class SessionPerformance:
-    """Performance metrics for a specific session."""
-    session: SessionType
-    total_trades: int
-    winning_trades: int
-    win_rate: float
-    total_profit: float
-    average_profit: float
-    profit_factor: float
-    best_pair: str
-    worst_pair: str
-
-
-@dataclass
-class ProfitTakingRule:
-    """Rule for automatic profit taking."""
-    name: str
-    enabled: bool
-    time_interval_minutes: int  # Time interval in minutes
-    min_profit_pips: float      # Minimum profit in pips to take
-    profit_percentage: float    # Percentage of profit to take (0.0-1.0)
-    max_trades_per_interval: int  # Maximum trades to close per interval
-    session_filter: Optional[SessionType] = None  # Apply only to specific session
-    symbol_filter: Optional[str] = None  # Apply only to specific symbol
-    last_execution: Optional[datetime] = None
-
-
-@dataclass
-class ActivePosition:
-    """Track active position for profit taking."""
-    ticket: int
-    symbol: str
-    order_type: str
-    volume: float
-    open_price: float
-    open_time: datetime
-    current_profit: float
-    current_profit_pips: float
-    session: SessionType
-    strategy: str
-
-
-class ProfitMonitor:
-    """Comprehensive profit monitoring and analysis system."""
-    
-    def __init__(self, data_dir: str = "data"):
-        self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
-        
-        self.trades: List[TradeRecord] = []
-        self.daily_pnl: Dict[str, float] = {}
-        self.session_pnl: Dict[str, Dict[str, float]] = {}
-        self.pair_pnl: Dict[str, float] = {}
-        self.strategy_pnl: Dict[str, float] = {}
-        
-        # Performance tracking
-        self.current_balance = 0.0
-        self.peak_balance = 0.0
-        self.max_drawdown = 0.0
-        self.max_drawdown_pct = 0.0
-        
-        # Risk metrics
-        self.daily_var_95 = 0.0
-        self.weekly_var_95 = 0.0
-        self.max_daily_loss = 0.0
-        self.consecutive_losses = 0
-        self.max_consecutive_losses = 0
-        
-        # Time-based profit taking
-        self.profit_taking_rules: List[ProfitTakingRule] = []
-        self.active_positions: Dict[int, ActivePosition] = {}
-        self.broker = None  # Will be set by trading bot
-        
-        # Initialize default profit taking rules
-        self._initialize_default_profit_taking_rules()
-        
-        # Load existing data
-        self._load_data()
-    
-    def _initialize_default_profit_taking_rules(self):
-        """Initialize default profit taking rules."""
-        default_rules = [
-            # Quick profit taking for scalping (15 minutes)
-            ProfitTakingRule(
-                name="Scalping Quick Profit",
-                enabled=True,
-                time_interval_minutes=15,
-                min_profit_pips=10.0,
-                profit_percentage=0.5,  # Take 50% of profit
-                max_trades_per_interval=3,
-                session_filter=None,
-                symbol_filter=None
-            ),
-            # Medium-term profit taking (1 hour)
-            ProfitTakingRule(
-                name="Medium Term Profit",
-                enabled=True,
-                time_interval_minutes=60,
-                min_profit_pips=20.0,
-                profit_percentage=0.7,  # Take 70% of profit
-                max_trades_per_interval=5,
-                session_filter=None,
-                symbol_filter=None
-            ),
-            # Session end profit taking (4 hours)
-            ProfitTakingRule(
-                name="Session End Profit",
-                enabled=True,
-                time_interval_minutes=240,
-                min_profit_pips=30.0,
-                profit_percentage=0.8,  # Take 80% of profit
-                max_trades_per_interval=10,
-                session_filter=None,
-                symbol_filter=None
-            ),
-            # Asian session specific (lower volatility)
-            ProfitTakingRule(
-                name="Asian Session Profit",
-                enabled=True,
-                time_interval_minutes=120,
-                min_profit_pips=15.0,
-                profit_percentage=0.6,
-                max_trades_per_interval=3,
-                session_filter=SessionType.ASIAN,
-                symbol_filter=None
-            ),
-            # London session specific (higher volatility)
-            ProfitTakingRule(
-                name="London Session Profit",
-                enabled=True,
-                time_interval_minutes=90,
-                min_profit_pips=25.0,
-                profit_percentage=0.7,
-                max_trades_per_interval=5,
-                session_filter=SessionType.LONDON,
-                symbol_filter=None
-            )
-        ]
-        
-        self.profit_taking_rules = default_rules
-        logger.info(f"Initialized {len(default_rules)} default profit taking rules")
-    
-    def set_broker(self, broker):
-        """Set broker reference for order operations."""
-        self.broker = broker
-        logger.info("Broker reference set for profit monitor")
-    
-    def add_profit_taking_rule(self, rule: ProfitTakingRule):
-        """Add a new profit taking rule."""
-        self.profit_taking_rules.append(rule)
-        logger.info(f"Added profit taking rule: {rule.name}")
-    
-    def remove_profit_taking_rule(self, rule_name: str):
-        """Remove a profit taking rule by name."""
-        self.profit_taking_rules = [r for r in self.profit_taking_rules if r.name != rule_name]
-        logger.info(f"Removed profit taking rule: {rule_name}")
-    
-    def enable_profit_taking_rule(self, rule_name: str):
-        """Enable a profit taking rule."""
-        for rule in self.profit_taking_rules:
-            if rule.name == rule_name:
-                rule.enabled = True
-                logger.info(f"Enabled profit taking rule: {rule_name}")
-                break
-    
-    def disable_profit_taking_rule(self, rule_name: str):
-        """Disable a profit taking rule."""
-        for rule in self.profit_taking_rules:
-            if rule.name == rule_name:
-                rule.enabled = False
-                logger.info(f"Disabled profit taking rule: {rule_name}")
-                break
-    
-    def add_active_position(self, position: ActivePosition):
-        """Add an active position for profit taking monitoring."""
-        self.active_positions[position.ticket] = position
-        logger.debug(f"Added active position: {position.symbol} (Ticket: {position.ticket})")
-    
-    def remove_active_position(self, ticket: int):
-        """Remove an active position."""
-        if ticket in self.active_positions:
-            del self.active_positions[ticket]
-            logger.debug(f"Removed active position: {ticket}")
-    
-    def update_position_profit(self, ticket: int, current_price: float, profit_pips: float):
-        """Update position profit for profit taking calculations."""
-        if ticket in self.active_positions:
-            position = self.active_positions[ticket]
-            
-            # Calculate current profit
-            if position.order_type == "BUY":
-                position.current_profit = (current_price - position.open_price) * position.volume
-            else:
-                position.current_profit = (position.open_price - current_price) * position.volume
-            
-            position.current_profit_pips = profit_pips
-            logger.debug(f"Updated position {ticket} profit: ${position.current_profit:.2f} ({profit_pips:.1f} pips)")
-    
-    def check_profit_taking(self, current_time: datetime = None) -> List[int]:
-        """Check and execute profit taking rules. Returns list of closed ticket numbers."""
-        if not self.broker or not self.active_positions:
-            return []
-        
-        if current_time is None:
-            current_time = datetime.now()
-        
-        closed_tickets = []
-        
-        for rule in self.profit_taking_rules:
-            if not rule.enabled:
-                continue
-            
-            # Check if it's time to execute this rule
-            if rule.last_execution:
-                time_since_last = current_time - rule.last_execution
-                if time_since_last.total_seconds() < rule.time_interval_minutes * 60:
-                    continue
-            
-            # Get positions that match this rule
-            matching_positions = self._get_matching_positions(rule)
-            
-            if not matching_positions:
-                continue
-            
-            # Sort by profit (highest first)
-            matching_positions.sort(key=lambda p: p.current_profit_pips, reverse=True)
-            
-            # Execute profit taking
-            closed_count = 0
-            for position in matching_positions:
-                if closed_count >= rule.max_trades_per_interval:
-                    break
-                
-                if position.current_profit_pips >= rule.min_profit_pips:
-                    if self._execute_profit_taking(position, rule):
-                        closed_tickets.append(position.ticket)
-                        closed_count += 1
-            
-            # Update rule execution time
-            if closed_count > 0:
-                rule.last_execution = current_time
-                logger.info(f"Executed profit taking rule '{rule.name}': closed {closed_count} positions")
-        
-        return closed_tickets
-    
-    def _get_matching_positions(self, rule: ProfitTakingRule) -> List[ActivePosition]:
-        """Get positions that match a profit taking rule."""
-        matching_positions = []
-        
-        for position in self.active_positions.values():
-            # Check session filter
-            if rule.session_filter and position.session != rule.session_filter:
-                continue
-            
-            # Check symbol filter
-            if rule.symbol_filter and position.symbol != rule.symbol_filter:
-                continue
-            
-            # Check if position is profitable
-            if position.current_profit_pips > 0:
-                matching_positions.append(position)
-        
-        return matching_positions
-    
-    def _execute_profit_taking(self, position: ActivePosition, rule: ProfitTakingRule) -> bool:
-        """Execute profit taking for a position."""
-        try:
-            # Calculate partial close volume
-            close_volume = position.volume * rule.profit_percentage
-            
-            # Get current price
-            current_price = self.broker.get_mid_price(position.symbol)
-            if not current_price:
-                logger.warning(f"Cannot get current price for {position.symbol}")
-                return False
-            
-            # Close partial position
-            if self.broker.close_order_partial(position.ticket, close_volume):
-                # Update position volume
-                position.volume -= close_volume
-                
-                # Calculate realized profit
-                if position.order_type == "BUY":
-                    realized_profit = (current_price - position.open_price) * close_volume
-                else:
-                    realized_profit = (position.open_price - current_price) * close_volume
-                
-                logger.info(f"Profit taking executed: {position.symbol} (Ticket: {position.ticket}) "
-                           f"Closed {close_volume:.2f} lots, Profit: ${realized_profit:.2f}")
-                
-                # If position is fully closed, remove from active positions
-                if position.volume <= 0.01:  # Minimum lot size
-                    self.remove_active_position(position.ticket)
-                
-                return True
-            else:
-                logger.error(f"Failed to execute profit taking for position {position.ticket}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error executing profit taking: {e}")
-            return False
-    
-    def get_profit_taking_status(self) -> Dict[str, Any]:
-        """Get status of profit taking rules and active positions."""
-        return {
-            'rules': [
-                {
-                    'name': rule.name,
-                    'enabled': rule.enabled,
-                    'time_interval_minutes': rule.time_interval_minutes,
-                    'min_profit_pips': rule.min_profit_pips,
-                    'profit_percentage': rule.profit_percentage,
-                    'last_execution': rule.last_execution.isoformat() if rule.last_execution else None
-                }
-                for rule in self.profit_taking_rules
-            ],
-            'active_positions': len(self.active_positions),
-            'total_profit_potential': sum(p.current_profit for p in self.active_positions.values()),
-            'positions_by_profit': [
-                {
-                    'ticket': p.ticket,
-                    'symbol': p.symbol,
-                    'profit_pips': p.current_profit_pips,
-                    'profit_usd': p.current_profit,
-                    'session': p.session.value
-                }
-                for p in sorted(self.active_positions.values(), 
-                              key=lambda x: x.current_profit_pips, reverse=True)
-            ]
-        }
-    
-    def _load_data(self):
-        """Load existing trade data from files."""
-        trades_file = self.data_dir / "trades.json"
-        if trades_file.exists():
-            try:
-                with open(trades_file, 'r') as f:
-                    trades_data = json.load(f)
-                
-                for trade_data in trades_data:
-                    trade = TradeRecord(
-                        ticket=trade_data['ticket'],
-                        symbol=trade_data['symbol'],
-                        order_type=trade_data['order_type'],
-                        volume=trade_data['volume'],
-                        open_price=trade_data['open_price'],
-                        close_price=trade_data.get('close_price'),
-                        open_time=datetime.fromisoformat(trade_data['open_time']),
-                        close_time=datetime.fromisoformat(trade_data['close_time']) if trade_data.get('close_time') else None,
-                        profit=trade_data['profit'],
-                        swap=trade_data['swap'],
-                        commission=trade_data['commission'],
-                        session=SessionType(trade_data['session']),
-                        strategy=trade_data['strategy'],
-                        stop_loss=trade_data.get('stop_loss'),
-                        take_profit=trade_data.get('take_profit'),
-                        exit_reason=trade_data.get('exit_reason')
-                    )
-                    self.trades.append(trade)
-                
-                logger.info(f"Loaded {len(self.trades)} historical trades")
-                self._recalculate_metrics()
-                
-            except Exception as e:
-                logger.error(f"Error loading trade data: {e}")
-    
-    def _save_data(self):
-        """Save trade data to files."""
-        try:
-            trades_file = self.data_dir / "trades.json"
-            trades_data = []
-            
-            for trade in self.trades:
-                trade_dict = asdict(trade)
-                trade_dict['open_time'] = trade.open_time.isoformat()
-                if trade.close_time:
-                    trade_dict['close_time'] = trade.close_time.isoformat()
-                trade_dict['session'] = trade.session.value
-                trades_data.append(trade_dict)
-            
-            with open(trades_file, 'w') as f:
-                json.dump(trades_data, f, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error saving trade data: {e}")
-    
-    def add_trade(self, trade: TradeRecord):
-        """Add a new trade record."""
-        self.trades.append(trade)
-        self._update_metrics(trade)
-        self._save_data()
-        
-        logger.info(f"Added trade: {trade.symbol} {trade.order_type} "
-                   f"Profit: {trade.profit:.2f}")
-    
-    def close_trade(self, ticket: int, close_price: float, 
-                   close_time: datetime, exit_reason: str = "manual"):
-        """Close an existing trade."""
-        for trade in self.trades:
-            if trade.ticket == ticket and trade.close_price is None:
-                trade.close_price = close_price
-                trade.close_time = close_time
-                trade.exit_reason = exit_reason
-                
-                # Recalculate profit if needed
-                if trade.order_type == "BUY":
-                    trade.profit = (close_price - trade.open_price) * trade.volume
-                else:
-                    trade.profit = (trade.open_price - close_price) * trade.volume
-                
-                self._update_metrics(trade)
-                self._save_data()
-                
-                logger.info(f"Closed trade {ticket}: {trade.symbol} "
-                           f"Profit: {trade.profit:.2f}")
-                break
-    
-    def _update_metrics(self, trade: TradeRecord):
-        """Update performance metrics with new trade."""
-        # Update daily P&L
-        date_str = trade.open_time.strftime("%Y-%m-%d")
-        self.daily_pnl[date_str] = self.daily_pnl.get(date_str, 0.0) + trade.profit
-        
-        # Update session P&L
-        session_str = trade.session.value
-        if session_str not in self.session_pnl:
-            self.session_pnl[session_str] = {}
-        self.session_pnl[session_str][date_str] = \
-            self.session_pnl[session_str].get(date_str, 0.0) + trade.profit
-        
-        # Update pair P&L
-        self.pair_pnl[trade.symbol] = self.pair_pnl.get(trade.symbol, 0.0) + trade.profit
-        
-        # Update strategy P&L
-        self.strategy_pnl[trade.strategy] = self.strategy_pnl.get(trade.strategy, 0.0) + trade.profit
-        
-        # Update balance and drawdown
-        self.current_balance += trade.profit
-        if self.current_balance > self.peak_balance:
-            self.peak_balance = self.current_balance
-        
-        # Calculate drawdown
-        if self.peak_balance > 0:
-            drawdown = (self.peak_balance - self.current_balance) / self.peak_balance
-            if drawdown > self.max_drawdown_pct:
-                self.max_drawdown_pct = drawdown
-                self.max_drawdown = self.peak_balance - self.current_balance
-        
-        # Update consecutive losses
-        if trade.profit < 0:
-            self.consecutive_losses += 1
-            if self.consecutive_losses > self.max_consecutive_losses:
-                self.max_consecutive_losses = self.consecutive_losses
-        else:
-            self.consecutive_losses = 0
-    
-    def _recalculate_metrics(self):
-        """Recalculate all metrics from trade history."""
-        self.daily_pnl.clear()
-        self.session_pnl.clear()
-        self.pair_pnl.clear()
-        self.strategy_pnl.clear()
-        
-        self.current_balance = 0.0
-        self.peak_balance = 0.0
-        self.max_drawdown = 0.0
-        self.max_drawdown_pct = 0.0
-        self.consecutive_losses = 0
-        self.max_consecutive_losses = 0
-        
-        for trade in self.trades:
-            self._update_metrics(trade)
-    
-    def get_performance_metrics(self, start_date: Optional[datetime] = None,
-                               end_date: Optional[datetime] = None) -> PerformanceMetrics:
-        """Calculate comprehensive performance metrics."""
-        # Filter trades by date range
-        filtered_trades = self.trades
-        if start_date:
-            filtered_trades = [t for t in filtered_trades if t.open_time >= start_date]
-        if end_date:
-            filtered_trades = [t for t in filtered_trades if t.open_time <= end_date]
-        
-        if not filtered_trades:
-            return PerformanceMetrics(
-                total_trades=0, winning_trades=0, losing_trades=0,
-                win_rate=0.0, total_profit=0.0, total_loss=0.0,
-                net_profit=0.0, profit_factor=0.0, average_win=0.0,
-                average_loss=0.0, largest_win=0.0, largest_loss=0.0,
-                max_drawdown=self.max_drawdown, sharpe_ratio=0.0,
-                sortino_ratio=0.0, calmar_ratio=0.0, total_volume=0.0,
-                average_trade_duration=timedelta(0)
-            )
-        
-        # Basic metrics
-        total_trades = len(filtered_trades)
-        winning_trades = len([t for t in filtered_trades if t.profit > 0])
-        losing_trades = len([t for t in filtered_trades if t.profit < 0])
-        win_rate = winning_trades / total_trades if total_trades > 0 else 0.0
-        
-        # Profit metrics
-        total_profit = sum(t.profit for t in filtered_trades if t.profit > 0)
-        total_loss = abs(sum(t.profit for t in filtered_trades if t.profit < 0))
-        net_profit = sum(t.profit for t in filtered_trades)
-        profit_factor = total_profit / total_loss if total_loss > 0 else float('inf')
-        
-        # Average metrics
-        wins = [t.profit for t in filtered_trades if t.profit > 0]
-        losses = [t.profit for t in filtered_trades if t.profit < 0]
-        average_win = np.mean(wins) if wins else 0.0
-        average_loss = np.mean(losses) if losses else 0.0
-        largest_win = max(wins) if wins else 0.0
-        largest_loss = min(losses) if losses else 0.0
-        
-        # Volume and duration
-        total_volume = sum(t.volume for t in filtered_trades)
-        durations = []
-        for trade in filtered_trades:
-            if trade.close_time:
-                duration = trade.close_time - trade.open_time
-                durations.append(duration)
-        average_duration = np.mean(durations) if durations else timedelta(0)
-        
-        # Risk-adjusted metrics
-        returns = [t.profit for t in filtered_trades]
-        sharpe_ratio = self._calculate_sharpe_ratio(returns)
-        sortino_ratio = self._calculate_sortino_ratio(returns)
-        calmar_ratio = net_profit / self.max_drawdown if self.max_drawdown > 0 else 0.0
-        
-        return PerformanceMetrics(
-            total_trades=total_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            win_rate=win_rate,
-            total_profit=total_profit,
-            total_loss=total_loss,
-            net_profit=net_profit,
-            profit_factor=profit_factor,
-            average_win=average_win,
-            average_loss=average_loss,
-            largest_win=largest_win,
-            largest_loss=largest_loss,
-            max_drawdown=self.max_drawdown,
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
-            calmar_ratio=calmar_ratio,
-            total_volume=total_volume,
-            average_trade_duration=average_duration
-        )
-    
-    def _calculate_sharpe_ratio(self, returns: List[float], risk_free_rate: float = 0.02) -> float:
-        """Calculate Sharpe ratio."""
-        if not returns:
-            return 0.0
-        
-        returns_array = np.array(returns)
-        excess_returns = returns_array - (risk_free_rate / 252)  # Daily risk-free rate
-        
-        if len(excess_returns) < 2:
-            return 0.0
-        
-        return np.mean(excess_returns) / np.std(excess_returns) if np.std(excess_returns) > 0 else 0.0
-    
-    def _calculate_sortino_ratio(self, returns: List[float], risk_free_rate: float = 0.02) -> float:
-        """Calculate Sortino ratio."""
-        if not returns:
-            return 0.0
-        
-        returns_array = np.array(returns)
-        excess_returns = returns_array - (risk_free_rate / 252)
-        negative_returns = excess_returns[excess_returns < 0]
-        
-        if len(negative_returns) < 2:
-            return 0.0
-        
-        downside_deviation = np.std(negative_returns)
-        return np.mean(excess_returns) / downside_deviation if downside_deviation > 0 else 0.0
-    
-    def get_session_performance(self) -> List[SessionPerformance]:
-        """Get performance metrics by session."""
-        session_performance = []
-        
-        for session in SessionType:
-            session_trades = [t for t in self.trades if t.session == session]
-            
-            if not session_trades:
-                continue
-            
-            total_trades = len(session_trades)
-            winning_trades = len([t for t in session_trades if t.profit > 0])
-            win_rate = winning_trades / total_trades
-            total_profit = sum(t.profit for t in session_trades)
-            average_profit = total_profit / total_trades
-            
-            # Calculate profit factor
-            session_wins = sum(t.profit for t in session_trades if t.profit > 0)
-            session_losses = abs(sum(t.profit for t in session_trades if t.profit < 0))
-            profit_factor = session_wins / session_losses if session_losses > 0 else float('inf')
-            
-            # Find best and worst pairs
-            pair_profits = {}
-            for trade in session_trades:
-                pair_profits[trade.symbol] = pair_profits.get(trade.symbol, 0.0) + trade.profit
-            
-            if pair_profits:
-                best_pair = max(pair_profits, key=pair_profits.get)
-                worst_pair = min(pair_profits, key=pair_profits.get)
-            else:
-                best_pair = "N/A"
-                worst_pair = "N/A"
-            
-            session_performance.append(SessionPerformance(
-                session=session,
-                total_trades=total_trades,
-                winning_trades=winning_trades,
-                win_rate=win_rate,
-                total_profit=total_profit,
-                average_profit=average_profit,
-                profit_factor=profit_factor,
-                best_pair=best_pair,
-                worst_pair=worst_pair
-            ))
-        
-        return session_performance
-    
-    def get_pair_performance(self) -> Dict[str, Dict[str, Any]]:
-        """Get performance metrics by currency pair."""
-        pair_performance = {}
-        
-        for trade in self.trades:
-            symbol = trade.symbol
-            if symbol not in pair_performance:
-                pair_performance[symbol] = {
-                    'total_trades': 0,
-                    'winning_trades': 0,
-                    'total_profit': 0.0,
-                    'total_volume': 0.0,
-                    'average_profit': 0.0,
-                    'win_rate': 0.0,
-                    'profit_factor': 0.0,
-                    'best_session': None,
-                    'worst_session': None
-                }
-            
-            pair_performance[symbol]['total_trades'] += 1
-            pair_performance[symbol]['total_profit'] += trade.profit
-            pair_performance[symbol]['total_volume'] += trade.volume
-            
-            if trade.profit > 0:
-                pair_performance[symbol]['winning_trades'] += 1
-        
-        # Calculate derived metrics
-        for symbol, metrics in pair_performance.items():
-            if metrics['total_trades'] > 0:
-                metrics['win_rate'] = metrics['winning_trades'] / metrics['total_trades']
-                metrics['average_profit'] = metrics['total_profit'] / metrics['total_trades']
-                
-                # Calculate profit factor
-                symbol_trades = [t for t in self.trades if t.symbol == symbol]
-                wins = sum(t.profit for t in symbol_trades if t.profit > 0)
-                losses = abs(sum(t.profit for t in symbol_trades if t.profit < 0))
-                metrics['profit_factor'] = wins / losses if losses > 0 else float('inf')
-                
-                # Find best and worst sessions
-                session_profits = {}
-                for trade in symbol_trades:
-                    session = trade.session.value
-                    session_profits[session] = session_profits.get(session, 0.0) + trade.profit
-                
-                if session_profits:
-                    metrics['best_session'] = max(session_profits, key=session_profits.get)
-                    metrics['worst_session'] = min(session_profits, key=session_profits.get)
-        
-        return pair_performance
-    
-    def get_daily_pnl(self, days: int = 30) -> Dict[str, float]:
-        """Get daily P&L for the last N days."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        daily_pnl = {}
-        current_date = start_date
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            daily_pnl[date_str] = self.daily_pnl.get(date_str, 0.0)
-            current_date += timedelta(days=1)
-        
-        return daily_pnl
-    
-    def get_risk_metrics(self) -> Dict[str, Any]:
-        """Get comprehensive risk metrics."""
-        if not self.trades:
-            return {}
-        
-        # Calculate Value at Risk
-        returns = [t.profit for t in self.trades]
-        returns_array = np.array(returns)
-        
-        daily_var_95 = np.percentile(returns_array, 5) if len(returns_array) > 0 else 0.0
-        
-        # Calculate weekly VaR (assuming 5 trades per week)
-        weekly_returns = []
-        for i in range(0, len(returns), 5):
-            weekly_returns.append(sum(returns[i:i+5]))
-        weekly_var_95 = np.percentile(weekly_returns, 5) if weekly_returns else 0.0
-        
-        # Maximum daily loss
-        max_daily_loss = min(self.daily_pnl.values()) if self.daily_pnl else 0.0
-        
-        return {
-            'daily_var_95': daily_var_95,
-            'weekly_var_95': weekly_var_95,
-            'max_daily_loss': max_daily_loss,
-            'max_drawdown': self.max_drawdown,
-            'max_drawdown_pct': self.max_drawdown_pct,
-            'max_consecutive_losses': self.max_consecutive_losses,
-            'current_consecutive_losses': self.consecutive_losses,
-            'total_trades': len(self.trades),
-            'current_balance': self.current_balance,
-            'peak_balance': self.peak_balance
-        }
-    
-    def generate_report(self, report_type: str = "comprehensive") -> Dict[str, Any]:
-        """Generate a comprehensive trading report."""
-        report = {
-            'generated_at': datetime.now().isoformat(),
-            'report_type': report_type,
-            'summary': {},
-            'performance': {},
-            'risk_metrics': {},
-            'session_analysis': {},
-            'pair_analysis': {},
-            'recommendations': []
-        }
-        
-        # Overall performance
-        metrics = self.get_performance_metrics()
-        report['performance'] = asdict(metrics)
-        
-        # Risk metrics
-        report['risk_metrics'] = self.get_risk_metrics()
-        
-        # Session analysis
-        session_perf = self.get_session_performance()
-        report['session_analysis'] = [asdict(sp) for sp in session_perf]
-        
-        # Pair analysis
-        pair_perf = self.get_pair_performance()
-        report['pair_analysis'] = pair_perf
-        
-        # Summary
-        report['summary'] = {
-            'total_trades': metrics.total_trades,
-            'net_profit': metrics.net_profit,
-            'win_rate': metrics.win_rate,
-            'profit_factor': metrics.profit_factor,
-            'max_drawdown': self.max_drawdown,
-            'sharpe_ratio': metrics.sharpe_ratio
-        }
-        
-        # Generate recommendations
-        recommendations = []
-        
-        if metrics.win_rate < 0.4:
-            recommendations.append("Consider reviewing strategy parameters - low win rate detected")
-        
-        if metrics.profit_factor < 1.2:
-            recommendations.append("Profit factor below optimal level - review risk management")
-        
-        if self.max_drawdown_pct > 0.2:
-            recommendations.append("High drawdown detected - consider reducing position sizes")
-        
-        # Find best performing session
-        if session_perf:
-            best_session = max(session_perf, key=lambda x: x.total_profit)
-            recommendations.append(f"Best performing session: {best_session.session.value}")
-        
-        # Find best performing pair
-        if pair_perf:
-            best_pair = max(pair_perf.items(), key=lambda x: x[1]['total_profit'])
-            recommendations.append(f"Best performing pair: {best_pair[0]}")
-        
-        report['recommendations'] = recommendations
-        
-        return report
-    
-    def save_report(self, report: Dict[str, Any], filename: Optional[str] = None):
-        """Save report to file."""
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"trading_report_{timestamp}.json"
-        
-        report_file = self.data_dir / filename
-        
-        try:
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
-            
-            logger.info(f"Trading report saved to {report_file}")
-            
-        except Exception as e:
-            logger.error(f"Error saving report: {e}")
-    
-    def get_realtime_status(self) -> Dict[str, Any]:
-        """Get real-time trading status."""
-        if not self.trades:
-            return {
-                'status': 'No trades yet',
-                'current_balance': 0.0,
-                'total_trades': 0,
-                'today_pnl': 0.0
-            }
-        
-        # Today's P&L
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_pnl = self.daily_pnl.get(today, 0.0)
-        
-        # Recent trades
-        recent_trades = sorted(self.trades, key=lambda x: x.open_time, reverse=True)[:5]
-        
-        return {
-            'status': 'Active',
-            'current_balance': self.current_balance,
-            'peak_balance': self.peak_balance,
-            'total_trades': len(self.trades),
-            'today_pnl': today_pnl,
-            'max_drawdown': self.max_drawdown,
-            'max_drawdown_pct': self.max_drawdown_pct,
-            'consecutive_losses': self.consecutive_losses,
-            'recent_trades': [
-                {
-                    'symbol': t.symbol,
-                    'type': t.order_type,
-                    'profit': t.profit,
-                    'time': t.open_time.strftime("%H:%M:%S")
-                }
-                for t in recent_trades
-            ]
+"""
+Comprehensive profit monitoring system for trading bot.
+"""
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Any
+from datetime import date, datetime, timedelta, timezone
+from dataclasses import dataclass, field
+from loguru import logger
+import heapq
+import itertools
+from collections import defaultdict, deque
+import json
+import orjson
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from src.core.config import SessionType
+
+
+# dataclass(slots=...) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _to_datetime64(value: Optional[datetime]) -> np.datetime64:
+    """Convert a datetime to naive-UTC datetime64[ns] (NaT for None)."""
+    if value is None:
+        return np.datetime64('NaT', 'ns')
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, 'ns')
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TradeRecord:
+    """Record of a single trade."""
+    ticket: int
+    symbol: str
+    order_type: str
+    volume: float
+    open_price: float
+    close_price: Optional[float]
+    open_time: datetime
+    close_time: Optional[datetime]
+    profit: float
+    swap: float
+    commission: float
+    session: SessionType
+    strategy: str
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    exit_reason: Optional[str]
+    closed_volume: float = 0.0  # Volume closed by partial profit taking, its profit already booked
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class PerformanceMetrics:
+    """Performance metrics for a trading period."""
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    total_profit: float
+    total_loss: float
+    net_profit: float
+    profit_factor: float
+    average_win: float
+    average_loss: float
+    largest_win: float
+    largest_loss: float
+    max_drawdown: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    calmar_ratio: float
+    total_volume: float
+    average_trade_duration: timedelta
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict."""
+        return {
+            'total_trades': self.total_trades,
+            'winning_trades': self.winning_trades,
+            'losing_trades': self.losing_trades,
+            'win_rate': self.win_rate,
+            'total_profit': self.total_profit,
+            'total_loss': self.total_loss,
+            'net_profit': self.net_profit,
+            'profit_factor': self.profit_factor,
+            'average_win': self.average_win,
+            'average_loss': self.average_loss,
+            'largest_win': self.largest_win,
+            'largest_loss': self.largest_loss,
+            'max_drawdown': self.max_drawdown,
+            'sharpe_ratio': self.sharpe_ratio,
+            'sortino_ratio': self.sortino_ratio,
+            'calmar_ratio': self.calmar_ratio,
+            'total_volume': self.total_volume,
+            'average_trade_duration': self.average_trade_duration
+        }
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class SessionPerformance:
+    """Performance metrics for a specific session."""
+    session: SessionType
+    total_trades: int
+    winning_trades: int
+    win_rate: float
+    total_profit: float
+    average_profit: float
+    profit_factor: float
+    best_pair: str
+    worst_pair: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values as a plain dict."""
+        return {
+            'session': self.session,
+            'total_trades': self.total_trades,
+            'winning_trades': self.winning_trades,
+            'win_rate': self.win_rate,
+            'total_profit': self.total_profit,
+            'average_profit': self.average_profit,
+            'profit_factor': self.profit_factor,
+            'best_pair': self.best_pair,
+            'worst_pair': self.worst_pair
+        }
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ProfitTakingRule:
+    """Rule for automatic profit taking."""
+    name: str
+    enabled: bool
+    time_interval_minutes: int  # Time interval in minutes
+    min_profit_pips: float      # Minimum profit in pips to take
+    profit_percentage: float    # Percentage of profit to take (0.0-1.0)
+    max_trades_per_interval: int  # Maximum trades to close per interval
+    session_filter: Optional[SessionType] = None  # Apply only to specific session
+    symbol_filter: Optional[str] = None  # Apply only to specific symbol
+    last_execution: Optional[datetime] = None
+    
+    @property
+    def interval_seconds(self) -> float:
+        """Time interval in seconds."""
+        return self.time_interval_minutes * 60.0
+    
+    @property
+    def last_execution_ts(self) -> Optional[float]:
+        """Last execution as a POSIX timestamp, None if never executed."""
+        return self.last_execution.timestamp() if self.last_execution else None
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ActivePosition:
+    """Track active position for profit taking."""
+    ticket: int
+    symbol: str
+    order_type: str
+    volume: float
+    open_price: float
+    open_time: datetime
+    current_profit: float
+    current_profit_pips: float
+    session: SessionType
+    strategy: str
+    order_sign: float = field(default=1.0, init=False, repr=False)  # +1 BUY, -1 SELL
+    
+    def __post_init__(self):
+        self.order_sign = 1.0 if self.order_type == "BUY" else -1.0
+
+
+@dataclass
+class _TradeAggregates:
+    """Running totals over all trades, updated as trades are added and closed."""
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    total_profit: float = 0.0  # Sum of winning trades
+    total_loss: float = 0.0    # Sum of losing trades (negative)
+    net_profit: float = 0.0
+    total_volume: float = 0.0
+    
+    def _apply(self, profit: float, sign: int):
+        if profit > 0:
+            self.winning_trades += sign
+            self.total_profit += sign * profit
+        elif profit < 0:
+            self.losing_trades += sign
+            self.total_loss += sign * profit
+        self.net_profit += sign * profit
+    
+    def add(self, profit: float, volume: float):
+        """Count a new trade."""
+        self.total_trades += 1
+        self.total_volume += volume
+        self._apply(profit, 1)
+    
+    def replace_profit(self, old_profit: float, new_profit: float):
+        """Swap a trade's profit, e.g. when it is closed at a new price."""
+        self._apply(old_profit, -1)
+        self._apply(new_profit, 1)
+    
+    def reset(self, profits: np.ndarray, volumes: np.ndarray):
+        """Recount the totals from the trade columns."""
+        wins = profits[profits > 0]
+        losses = profits[profits < 0]
+        self.total_trades = int(profits.size)
+        self.winning_trades = int(wins.size)
+        self.losing_trades = int(losses.size)
+        self.total_profit = float(wins.sum())
+        self.total_loss = float(losses.sum())
+        self.net_profit = float(profits.sum())
+        self.total_volume = float(volumes.sum())
+    
+    def snapshot(self) -> Tuple[int, int, int, float, float, float, float]:
+        """Consistent copy of the counters."""
+        return (self.total_trades, self.winning_trades, self.losing_trades,
+                self.total_profit, self.total_loss, self.net_profit, self.total_volume)
+
+
+def _trade_to_dict(trade: TradeRecord) -> Dict[str, Any]:
+    """Convert a trade to a JSON-serializable dict."""
+    return {
+        'ticket': trade.ticket,
+        'symbol': trade.symbol,
+        'order_type': trade.order_type,
+        'volume': trade.volume,
+        'open_price': trade.open_price,
+        'close_price': trade.close_price,
+        'open_time': trade.open_time.isoformat(),
+        'close_time': trade.close_time.isoformat() if trade.close_time else None,
+        'profit': trade.profit,
+        'swap': trade.swap,
+        'commission': trade.commission,
+        'session': trade.session.value,
+        'strategy': trade.strategy,
+        'stop_loss': trade.stop_loss,
+        'take_profit': trade.take_profit,
+        'exit_reason': trade.exit_reason,
+        'closed_volume': trade.closed_volume
+    }
+
+
+def _trade_from_dict(trade_data: Dict[str, Any]) -> TradeRecord:
+    """Build a trade from its serialized dict."""
+    # Parsed strings are fresh objects per record; interning shares the few distinct
+    # symbols, order types, strategies and exit reasons across the whole history
+    exit_reason = trade_data.get('exit_reason')
+    return TradeRecord(
+        ticket=trade_data['ticket'],
+        symbol=sys.intern(trade_data['symbol']),
+        order_type=sys.intern(trade_data['order_type']),
+        volume=trade_data['volume'],
+        open_price=trade_data['open_price'],
+        close_price=trade_data.get('close_price'),
+        open_time=datetime.fromisoformat(trade_data['open_time']),
+        close_time=datetime.fromisoformat(trade_data['close_time']) if trade_data.get('close_time') else None,
+        profit=trade_data['profit'],
+        swap=trade_data['swap'],
+        commission=trade_data['commission'],
+        session=SessionType(trade_data['session']),
+        strategy=sys.intern(trade_data['strategy']),
+        stop_loss=trade_data.get('stop_loss'),
+        take_profit=trade_data.get('take_profit'),
+        exit_reason=sys.intern(exit_reason) if exit_reason is not None else None,
+        closed_volume=trade_data.get('closed_volume', 0.0)
+    )
+
+
+class ProfitMonitor:
+    """Comprehensive profit monitoring and analysis system."""
+    
+    # Per-trade array columns and their dtypes
+    TRADE_COLUMNS = {
+        '_profits': np.float64,
+        '_volumes': np.float64,
+        '_open_times': 'datetime64[ns]',
+        '_close_times': 'datetime64[ns]',
+        '_symbol_ids': np.int32,
+        '_session_ids': np.int8,
+        '_strategy_ids': np.int32
+    }
+    INITIAL_CAPACITY = 1024
+    # Small-int codes for the categorical trade fields
+    SESSIONS = list(SessionType)
+    SESSION_INDEX = {session: i for i, session in enumerate(SESSIONS)}
+    # Journal entries written before the trades are compacted into a snapshot
+    SNAPSHOT_INTERVAL = 1000
+    # Trade records kept in memory; older closed trades move to monthly archive files
+    # at snapshot time (the columns keep the full history for the metrics)
+    MAX_HOT_TRADES = 10_000
+    # Number of most recent balance updates covered by rolling_drawdown()
+    ROLLING_DRAWDOWN_WINDOW = 100
+    # Per-position array columns mirrored from active_positions for the rule scans
+    POSITION_COLUMNS = {
+        'ticket': np.int64,
+        'symbol': np.int32,
+        'session': np.int8,
+        'open_price': np.float64,
+        'side': np.int8,  # +1 BUY, -1 SELL
+        'pips': np.float64,
+        'seq': np.int64,  # insertion order, the tie-break between equal profits
+        'position': object
+    }
+    
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(exist_ok=True)
+        
+        self.trades: List[TradeRecord] = []
+        self.daily_pnl: Dict[str, float] = defaultdict(float)
+        self.session_pnl: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.pair_pnl: Dict[str, float] = defaultdict(float)
+        self.strategy_pnl: Dict[str, float] = defaultdict(float)
+        
+        # Held by writers and by cache misses, so a half-applied trade is never
+        # read into a cached result; cache hits stay lock-free
+        self._lock = threading.RLock()
+        
+        # Cached analysis results, invalidated whenever the trades change
+        self._trades_version = 0
+        self._metrics_cache: Dict[Tuple, Any] = {}
+        
+        # Column-oriented copies of the trade fields for vectorized metrics;
+        # buffers grow geometrically and self._<column> views cover the filled rows
+        self._n = 0
+        # Column row of self.trades[0]; rows before it belong to archived trades
+        self._trades_offset = 0
+        self._open_times_sorted = True
+        self._symbol_id: Dict[str, int] = {}
+        self._symbol_names: List[str] = []
+        self._strategy_id: Dict[str, int] = {}
+        self._strategy_names: List[str] = []
+        # Rows of each ticket, so closing a trade does not scan the history
+        self._ticket_rows: Dict[int, List[int]] = defaultdict(list)
+        self._buffers: Dict[str, np.ndarray] = {
+            name: np.empty(self.INITIAL_CAPACITY, dtype=dtype) for name, dtype in self.TRADE_COLUMNS.items()
+        }
+        self._publish_views()
+        
+        # Performance tracking
+        self.current_balance = 0.0
+        self.peak_balance = 0.0
+        self.max_drawdown = 0.0
+        self.max_drawdown_pct = 0.0
+        
+        # Monotonic (index, balance) deque holding the rolling-window peak at the front
+        self._peak_deque: deque = deque()
+        self._balance_updates = 0
+        
+        # Risk metrics
+        self.daily_var_95 = 0.0
+        self.weekly_var_95 = 0.0
+        self.max_daily_loss = 0.0
+        self.consecutive_losses = 0
+        self.max_consecutive_losses = 0
+        
+        # Time-based profit taking
+        self.profit_taking_rules: List[ProfitTakingRule] = []
+        self.active_positions: Dict[int, ActivePosition] = {}
+        # Totals over the whole history, so unfiltered metrics skip the per-trade masks
+        self._aggregates = _TradeAggregates()
+        # Per-symbol, per-session and per-(session, symbol) totals, updated per trade
+        self._group_arrays: Dict[str, np.ndarray] = self._group_totals()
+        
+        # Rows of the position columns; removal moves the last row into the gap
+        self._position_rows: Dict[int, int] = {}
+        self._position_symbol_id: Dict[str, int] = {}
+        self._position_symbols: List[str] = []  # symbol id -> symbol
+        self._position_count = 0
+        self._position_seq = 0
+        self._position_columns: Dict[str, np.ndarray] = {
+            name: np.empty(16, dtype=dtype) for name, dtype in self.POSITION_COLUMNS.items()
+        }
+        self.broker = None  # Will be set by trading bot
+        
+        # Today's date string and the timestamp of the next local midnight
+        self._today_str = ""
+        self._today_expires = 0.0
+        
+        # Trade events appended to the journal since the last snapshot
+        self._journal_entries = 0
+        
+        # Initialize default profit taking rules
+        self._initialize_default_profit_taking_rules()
+        
+        # Load existing data
+        self._load_data()
+    
+    def _initialize_default_profit_taking_rules(self):
+        """Initialize default profit taking rules."""
+        default_rules = [
+            # Quick profit taking for scalping (15 minutes)
+            ProfitTakingRule(
+                name="Scalping Quick Profit",
+                enabled=True,
+                time_interval_minutes=15,
+                min_profit_pips=10.0,
+                profit_percentage=0.5,  # Take 50% of profit
+                max_trades_per_interval=3,
+                session_filter=None,
+                symbol_filter=None
+            ),
+            # Medium-term profit taking (1 hour)
+            ProfitTakingRule(
+                name="Medium Term Profit",
+                enabled=True,
+                time_interval_minutes=60,
+                min_profit_pips=20.0,
+                profit_percentage=0.7,  # Take 70% of profit
+                max_trades_per_interval=5,
+                session_filter=None,
+                symbol_filter=None
+            ),
+            # Session end profit taking (4 hours)
+            ProfitTakingRule(
+                name="Session End Profit",
+                enabled=True,
+                time_interval_minutes=240,
+                min_profit_pips=30.0,
+                profit_percentage=0.8,  # Take 80% of profit
+                max_trades_per_interval=10,
+                session_filter=None,
+                symbol_filter=None
+            ),
+            # Asian session specific (lower volatility)
+            ProfitTakingRule(
+                name="Asian Session Profit",
+                enabled=True,
+                time_interval_minutes=120,
+                min_profit_pips=15.0,
+                profit_percentage=0.6,
+                max_trades_per_interval=3,
+                session_filter=SessionType.ASIAN,
+                symbol_filter=None
+            ),
+            # London session specific (higher volatility)
+            ProfitTakingRule(
+                name="London Session Profit",
+                enabled=True,
+                time_interval_minutes=90,
+                min_profit_pips=25.0,
+                profit_percentage=0.7,
+                max_trades_per_interval=5,
+                session_filter=SessionType.LONDON,
+                symbol_filter=None
+            )
+        ]
+        
+        self.profit_taking_rules = default_rules
+        logger.info(f"Initialized {len(default_rules)} default profit taking rules")
+    
+    def set_broker(self, broker):
+        """Set broker reference for order operations."""
+        self.broker = broker
+        logger.info("Broker reference set for profit monitor")
+    
+    def add_profit_taking_rule(self, rule: ProfitTakingRule):
+        """Add a new profit taking rule."""
+        self.profit_taking_rules.append(rule)
+        logger.info(f"Added profit taking rule: {rule.name}")
+    
+    def add_profit_taking_rules(self, rules: List[ProfitTakingRule]):
+        """Add several profit taking rules at once."""
+        self.profit_taking_rules.extend(rules)
+        logger.info(f"Added {len(rules)} profit taking rules")
+    
+    def remove_profit_taking_rule(self, rule_name: str):
+        """Remove a profit taking rule by name."""
+        self.profit_taking_rules = [r for r in self.profit_taking_rules if r.name != rule_name]
+        logger.info(f"Removed profit taking rule: {rule_name}")
+    
+    def enable_profit_taking_rule(self, rule_name: str):
+        """Enable a profit taking rule."""
+        for rule in self.profit_taking_rules:
+            if rule.name == rule_name:
+                rule.enabled = True
+                logger.info(f"Enabled profit taking rule: {rule_name}")
+                break
+    
+    def disable_profit_taking_rule(self, rule_name: str):
+        """Disable a profit taking rule."""
+        for rule in self.profit_taking_rules:
+            if rule.name == rule_name:
+                rule.enabled = False
+                logger.info(f"Disabled profit taking rule: {rule_name}")
+                break
+    
+    def add_active_position(self, position: ActivePosition):
+        """Add an active position for profit taking monitoring."""
+        self.active_positions[position.ticket] = position
+        self._store_position_row(position)
+        logger.debug(f"Added active position: {position.symbol} (Ticket: {position.ticket})")
+    
+    def remove_active_position(self, ticket: int):
+        """Remove an active position."""
+        if ticket in self.active_positions:
+            del self.active_positions[ticket]
+            self._drop_position_row(ticket)
+            logger.debug(f"Removed active position: {ticket}")
+    
+    def update_position_profit(self, ticket: int, current_price: float, profit_pips: float):
+        """Update position profit for profit taking calculations."""
+        if ticket in self.active_positions:
+            position = self.active_positions[ticket]
+            
+            # Calculate current profit
+            position.current_profit = (current_price - position.open_price) * position.volume * position.order_sign
+            
+            position.current_profit_pips = profit_pips
+            self._position_columns['pips'][self._position_rows[ticket]] = profit_pips
+            logger.debug(f"Updated position {ticket} profit: ${position.current_profit:.2f} ({profit_pips:.1f} pips)")
+    
+    def position_symbols(self) -> List[str]:
+        """Symbols with at least one active position."""
+        symbol_ids = np.unique(self._position_columns['symbol'][:self._position_count])
+        return [self._position_symbols[i] for i in symbol_ids.tolist()]
+    
+    def update_position_profits(self, prices: Dict[str, float], pip_values: Dict[str, float]):
+        """Update the profit of every active position from per-symbol prices and pip sizes."""
+        n = self._position_count
+        if n == 0:
+            return
+        
+        # Per-symbol inputs spread over the position rows through the symbol ids;
+        # positions whose symbol lacks either value keep their previous profit
+        symbol_prices = np.full(len(self._position_symbols), np.nan)
+        symbol_pips = np.full(len(self._position_symbols), np.nan)
+        for symbol, symbol_id in self._position_symbol_id.items():
+            symbol_prices[symbol_id] = prices.get(symbol, np.nan)
+            symbol_pips[symbol_id] = pip_values.get(symbol, np.nan)
+        
+        columns = self._position_columns
+        symbol_ids = columns['symbol'][:n]
+        current_prices = symbol_prices[symbol_ids]
+        moves = columns['side'][:n] * (current_prices - columns['open_price'][:n])
+        profit_pips = moves / symbol_pips[symbol_ids]
+        rows = np.flatnonzero(~np.isnan(profit_pips))
+        columns['pips'][rows] = profit_pips[rows]
+        
+        # Mirror into the position records, which carry the volume for the money profit
+        for position, move, pips in zip(columns['position'][rows], moves[rows].tolist(), profit_pips[rows].tolist()):
+            position.current_profit = move * position.volume
+            position.current_profit_pips = pips
+    
+    def check_profit_taking(self, current_time: datetime = None) -> List[int]:
+        """Check and execute profit taking rules.
+        
+        Partial closes are booked on the trade records here. Returns the tickets of the
+        positions that were closed in full and are no longer monitored.
+        """
+        if not self.broker or not self.active_positions:
+            return []
+        
+        if current_time is None:
+            current_time = datetime.now()
+        
+        closed_tickets = []
+        now_ts = current_time.timestamp()
+        
+        for rule in self.profit_taking_rules:
+            if not rule.enabled:
+                continue
+            
+            # Check if it's time to execute this rule
+            last_execution_ts = rule.last_execution_ts
+            if last_execution_ts is not None and now_ts - last_execution_ts < rule.interval_seconds:
+                continue
+            
+            # Get positions that match this rule and clear its profit threshold
+            rows = self._get_matching_rows(rule)
+            if rows.size == 0:
+                continue
+            
+            # Execute profit taking, highest profit first
+            closed_count = 0
+            for position in self._by_profit_desc(rows, rule.max_trades_per_interval):
+                if closed_count >= rule.max_trades_per_interval:
+                    break
+                
+                if self._execute_profit_taking(position, rule, current_time):
+                    if position.ticket not in self.active_positions:
+                        closed_tickets.append(position.ticket)
+                    closed_count += 1
+            
+            # Update rule execution time
+            if closed_count > 0:
+                rule.last_execution = current_time
+                logger.info(f"Executed profit taking rule '{rule.name}': closed {closed_count} positions")
+        
+        return closed_tickets
+    
+    def _store_position_row(self, position: ActivePosition):
+        """Write a position into the position columns, reusing its row if already tracked."""
+        row = self._position_rows.get(position.ticket)
+        if row is None:
+            if self._position_count == len(self._position_columns['ticket']):
+                for name, column in self._position_columns.items():
+                    grown = np.empty(2 * len(column), dtype=column.dtype)
+                    grown[:self._position_count] = column[:self._position_count]
+                    self._position_columns[name] = grown
+            row = self._position_rows[position.ticket] = self._position_count
+            self._position_count += 1
+            self._position_columns['seq'][row] = self._position_seq
+            self._position_seq += 1
+        
+        symbol_id = self._position_symbol_id.get(position.symbol)
+        if symbol_id is None:
+            symbol_id = self._position_symbol_id[position.symbol] = len(self._position_symbols)
+            self._position_symbols.append(position.symbol)
+        columns = self._position_columns
+        columns['ticket'][row] = position.ticket
+        columns['symbol'][row] = symbol_id
+        columns['session'][row] = self.SESSION_INDEX[position.session]
+        columns['open_price'][row] = position.open_price
+        columns['side'][row] = position.order_sign
+        columns['pips'][row] = position.current_profit_pips
+        columns['position'][row] = position
+    
+    def _drop_position_row(self, ticket: int):
+        """Remove a position's row, moving the last row into its place."""
+        row = self._position_rows.pop(ticket)
+        last = self._position_count - 1
+        columns = self._position_columns
+        if row != last:
+            for column in columns.values():
+                column[row] = column[last]
+            self._position_rows[int(columns['ticket'][row])] = row
+        columns['position'][last] = None
+        self._position_count = last
+    
+    def _get_matching_rows(self, rule: ProfitTakingRule) -> np.ndarray:
+        """Rows of the positions that match a profit taking rule and clear its threshold."""
+        n = self._position_count
+        columns = self._position_columns
+        pips = columns['pips'][:n]
+        mask = (pips > 0) & (pips >= rule.min_profit_pips)
+        if rule.session_filter:
+            mask &= columns['session'][:n] == self.SESSION_INDEX[rule.session_filter]
+        if rule.symbol_filter:
+            symbol_id = self._position_symbol_id.get(rule.symbol_filter)
+            if symbol_id is None:
+                return np.empty(0, dtype=np.intp)
+            mask &= columns['symbol'][:n] == symbol_id
+        return np.flatnonzero(mask)
+    
+    def _by_profit_desc(self, rows: np.ndarray, count: int):
+        """Yield the positions in `rows` by profit (highest first), ordering only the top `count` up front."""
+        # Copies, so closing positions (which moves rows) does not disturb the iteration
+        pips = self._position_columns['pips'][rows]
+        seq = self._position_columns['seq'][rows]
+        positions = self._position_columns['position'][rows]
+        
+        top = np.ones(rows.size, dtype=bool)
+        if 0 < count < rows.size:
+            # Everything at or above the count-th largest profit, ties included
+            threshold = np.partition(pips, rows.size - count)[rows.size - count]
+            top = pips >= threshold
+        
+        # The remainder is only ordered when some of the top positions could not be closed
+        for part in (top, ~top):
+            index = np.flatnonzero(part)
+            yield from positions[index[np.lexsort((seq[index], -pips[index]))]]
+    
+    def _execute_profit_taking(self, position: ActivePosition, rule: ProfitTakingRule,
+                               current_time: datetime) -> bool:
+        """Execute profit taking for a position, booking the closed volume on its trade record."""
+        try:
+            # Calculate partial close volume
+            close_volume = position.volume * rule.profit_percentage
+            
+            # Get current price
+            current_price = self.broker.get_mid_price(position.symbol)
+            if not current_price:
+                logger.warning(f"Cannot get current price for {position.symbol}")
+                return False
+            
+            # Close partial position
+            if self.broker.close_order_partial(position.ticket, close_volume):
+                # Update position volume
+                position.volume -= close_volume
+                
+                # Calculate realized profit
+                realized_profit = (current_price - position.open_price) * close_volume * position.order_sign
+                
+                logger.info(f"Profit taking executed: {position.symbol} (Ticket: {position.ticket}) "
+                           f"Closed {close_volume:.2f} lots, Profit: ${realized_profit:.2f}")
+                
+                # If position is fully closed, close its trade and stop monitoring it;
+                # otherwise book the closed part
+                if position.volume <= 0.01:  # Minimum lot size
+                    self.close_trade(position.ticket, current_price, current_time, "profit_taking")
+                    self.remove_active_position(position.ticket)
+                else:
+                    self.close_trade_partial(position.ticket, close_volume, current_price)
+                
+                return True
+            else:
+                logger.error(f"Failed to execute profit taking for position {position.ticket}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Error executing profit taking: {e}")
+            return False
+    
+    def get_profit_taking_status(self) -> Dict[str, Any]:
+        """Get status of profit taking rules and active positions."""
+        return {
+            'rules': [
+                {
+                    'name': rule.name,
+                    'enabled': rule.enabled,
+                    'time_interval_minutes': rule.time_interval_minutes,
+                    'min_profit_pips': rule.min_profit_pips,
+                    'profit_percentage': rule.profit_percentage,
+                    'last_execution': rule.last_execution.isoformat() if rule.last_execution else None
+                }
+                for rule in self.profit_taking_rules
+            ],
+            'active_positions': len(self.active_positions),
+            'total_profit_potential': sum(p.current_profit for p in self.active_positions.values()),
+            'positions_by_profit': [
+                {
+                    'ticket': p.ticket,
+                    'symbol': p.symbol,
+                    'profit_pips': p.current_profit_pips,
+                    'profit_usd': p.current_profit,
+                    'session': p.session.value
+                }
+                for p in sorted(self.active_positions.values(), 
+                              key=lambda x: x.current_profit_pips, reverse=True)
+            ]
+        }
+    
+    def _load_data(self):
+        """Load the trade snapshot and replay the journal written since."""
+        trades_file = self.data_dir / "trades.json"
+        journal_file = self.data_dir / "trades.ndjson"
+        if not trades_file.exists() and not journal_file.exists():
+            return
+        
+        try:
+            archived = self.load_archived_trades()
+            # Trades archived just before a crash may still be in the old snapshot
+            archived_tickets = {trade.ticket for trade in archived}
+            
+            if trades_file.exists():
+                with open(trades_file, 'rb') as f:
+                    trades_data = orjson.loads(f.read())
+                self.trades.extend(trade for trade in map(_trade_from_dict, trades_data)
+                                   if trade.ticket not in archived_tickets)
+            
+            if journal_file.exists():
+                positions = {trade.ticket: i for i, trade in enumerate(self.trades)}
+                with open(journal_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        # Entries carry the full trade, so replaying one twice is harmless
+                        trade = _trade_from_dict(orjson.loads(line)['trade'])
+                        if trade.ticket in archived_tickets:
+                            continue
+                        if trade.ticket in positions:
+                            self.trades[positions[trade.ticket]] = trade
+                        else:
+                            positions[trade.ticket] = len(self.trades)
+                            self.trades.append(trade)
+                        self._journal_entries += 1
+            
+            logger.info(f"Loaded {len(archived) + len(self.trades)} historical trades "
+                       f"({len(archived)} archived)")
+            self._rebuild_arrays(archived)
+            self._trades_version += 1
+            self._recalculate_metrics()
+            
+        except Exception as e:
+            logger.error(f"Error loading trade data: {e}")
+    
+    def load_archived_trades(self) -> List[TradeRecord]:
+        """Load the trades spilled to the monthly archive files, oldest month first."""
+        trades = []
+        for archive_file in sorted(self.data_dir.glob("trades_[0-9][0-9][0-9][0-9][0-9][0-9].ndjson")):
+            with open(archive_file, 'rb') as f:
+                trades.extend(_trade_from_dict(orjson.loads(line)) for line in f if line.strip())
+        return trades
+    
+    def _archive_cold_trades(self):
+        """Move closed trades beyond the hot window to the monthly archive files."""
+        excess = len(self.trades) - self.MAX_HOT_TRADES
+        count = 0
+        # An old trade that is still open pins the window until it is closed
+        while count < excess and self.trades[count].close_price is not None:
+            count += 1
+        if count == 0:
+            return
+        
+        cold = self.trades[:count]
+        by_month: Dict[str, List[TradeRecord]] = defaultdict(list)
+        for trade in cold:
+            by_month[trade.open_time.strftime("%Y%m")].append(trade)
+        
+        # All months or none: a failed append truncates the files back to their old sizes,
+        # so the next snapshot's retry cannot archive a trade twice
+        appended: List[Tuple[Path, int]] = []
+        try:
+            for month, trades in by_month.items():
+                archive_file = self.data_dir / f"trades_{month}.ndjson"
+                size = archive_file.stat().st_size if archive_file.exists() else 0
+                with open(archive_file, 'ab') as f:
+                    appended.append((archive_file, size))
+                    f.write(b"".join(orjson.dumps(_trade_to_dict(trade), option=orjson.OPT_APPEND_NEWLINE)
+                                     for trade in trades))
+        except Exception as e:
+            logger.error(f"Error archiving trades: {e}")
+            for archive_file, size in appended:
+                try:
+                    with open(archive_file, 'r+b') as f:
+                        f.truncate(size)
+                except Exception as rollback_error:
+                    logger.error(f"Error rolling back {archive_file.name}: {rollback_error}")
+            return
+        
+        del self.trades[:count]
+        self._trades_offset += count
+        for trade in cold:
+            rows = [row for row in self._ticket_rows.pop(trade.ticket, ()) if row >= self._trades_offset]
+            if rows:
+                self._ticket_rows[trade.ticket] = rows
+        logger.info(f"Archived {count} closed trades")
+    
+    def _append_journal(self, event: str, trade: TradeRecord):
+        """Append a trade event to the journal, snapshotting periodically."""
+        try:
+            with open(self.data_dir / "trades.ndjson", 'ab') as f:
+                f.write(orjson.dumps({'event': event, 'trade': _trade_to_dict(trade)},
+                                     option=orjson.OPT_APPEND_NEWLINE))
+            self._journal_entries += 1
+        except Exception as e:
+            logger.error(f"Error writing trade journal: {e}")
+            return
+        
+        if self._journal_entries >= self.SNAPSHOT_INTERVAL:
+            self._save_data()
+    
+    def _save_data(self):
+        """Archive cold trades, write a snapshot of the rest and reset the journal."""
+        self._archive_cold_trades()
+        
+        try:
+            trades_file = self.data_dir / "trades.json"
+            tmp_file = trades_file.with_suffix(".json.tmp")
+            trades_data = [_trade_to_dict(trade) for trade in self.trades]
+            
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(trades_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, trades_file)
+            
+            # The snapshot now holds every journaled event
+            open(self.data_dir / "trades.ndjson", 'w').close()
+            self._journal_entries = 0
+            
+        except Exception as e:
+            logger.error(f"Error saving trade data: {e}")
+    
+    @staticmethod
+    def _intern(codes: Dict[str, int], names: List[str], value: str) -> int:
+        """Integer code for a string, assigned in order of first appearance."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(names)
+            names.append(value)
+        return code
+    
+    def _trade_row(self, trade: TradeRecord) -> Dict[str, Any]:
+        """Column values for a trade."""
+        return {
+            '_profits': trade.profit,
+            '_volumes': trade.volume,
+            '_open_times': _to_datetime64(trade.open_time),
+            '_close_times': _to_datetime64(trade.close_time),
+            '_symbol_ids': self._intern(self._symbol_id, self._symbol_names, trade.symbol),
+            '_session_ids': self.SESSION_INDEX[trade.session],
+            '_strategy_ids': self._intern(self._strategy_id, self._strategy_names, trade.strategy)
+        }
+    
+    def _publish_views(self):
+        """Point the column attributes at the filled part of each buffer."""
+        for name, buffer in self._buffers.items():
+            setattr(self, name, buffer[:self._n])
+    
+    def _rebuild_arrays(self, archived: List[TradeRecord] = ()):
+        """Rebuild the per-field trade arrays from the archived trades followed by the trade list."""
+        self._trades_offset = len(archived)
+        self._n = self._trades_offset + len(self.trades)
+        capacity = self.INITIAL_CAPACITY
+        while capacity < self._n:
+            capacity *= 2
+        
+        self._symbol_id = {}
+        self._symbol_names = []
+        self._strategy_id = {}
+        self._strategy_names = []
+        self._ticket_rows.clear()
+        for i, trade in enumerate(self.trades, self._trades_offset):
+            self._ticket_rows[trade.ticket].append(i)
+        
+        rows = [self._trade_row(t) for t in itertools.chain(archived, self.trades)]
+        for name, dtype in self.TRADE_COLUMNS.items():
+            buffer = np.empty(capacity, dtype=dtype)
+            buffer[:self._n] = [row[name] for row in rows]
+            self._buffers[name] = buffer
+        self._publish_views()
+        self._open_times_sorted = bool(np.all(self._open_times[1:] >= self._open_times[:-1]))
+    
+    def _append_trade_row(self, trade: TradeRecord):
+        """Append a trade to the column buffers, doubling them when full."""
+        if self._n == len(self._buffers['_profits']):
+            for name, buffer in self._buffers.items():
+                grown = np.empty(2 * len(buffer), dtype=buffer.dtype)
+                grown[:self._n] = buffer[:self._n]
+                self._buffers[name] = grown
+        
+        row = self._trade_row(trade)
+        if self._n and row['_open_times'] < self._buffers['_open_times'][self._n - 1]:
+            self._open_times_sorted = False
+        for name, value in row.items():
+            self._buffers[name][self._n] = value
+        self._ticket_rows[trade.ticket].append(self._n)
+        self._n += 1
+        self._publish_views()
+    
+    def add_trade(self, trade: TradeRecord):
+        """Add a new trade record."""
+        with self._lock:
+            self.trades.append(trade)
+            self._append_trade_row(trade)
+            self._aggregates.add(trade.profit, trade.volume)
+            self._add_to_group_totals(trade)
+            self._update_metrics(trade)
+            self._trades_version += 1
+            self._append_journal('add', trade)
+        
+        logger.info(f"Added trade: {trade.symbol} {trade.order_type} "
+                   f"Profit: {trade.profit:.2f}")
+    
+    def close_trade(self, ticket: int, close_price: float, 
+                   close_time: datetime, exit_reason: str = "manual"):
+        """Close an existing trade, adding the profit on its still open volume."""
+        with self._lock:
+            i = self._open_trade_row(ticket)
+            if i is None:
+                return
+            
+            trade = self.trades[i - self._trades_offset]
+            trade.close_price = close_price
+            trade.close_time = close_time
+            trade.exit_reason = exit_reason
+            self._close_times[i] = _to_datetime64(close_time)
+            
+            # Partial closes have already booked their part of the profit
+            realized_profit = self._price_profit(trade, close_price, trade.volume - trade.closed_volume)
+            self._book_profit(i, trade, realized_profit)
+            self._append_journal('close', trade)
+            
+            logger.info(f"Closed trade {ticket}: {trade.symbol} "
+                       f"Profit: {trade.profit:.2f}")
+    
+    def close_trade_partial(self, ticket: int, volume: float, close_price: float):
+        """Book the profit of part of an open trade's volume, leaving the rest open."""
+        with self._lock:
+            i = self._open_trade_row(ticket)
+            if i is None:
+                return
+            
+            trade = self.trades[i - self._trades_offset]
+            trade.closed_volume += volume
+            realized_profit = self._price_profit(trade, close_price, volume)
+            self._book_profit(i, trade, realized_profit)
+            self._append_journal('partial', trade)
+            
+            logger.info(f"Partially closed trade {ticket}: {trade.symbol} {volume:.2f} lots "
+                       f"Profit: {realized_profit:.2f}")
+    
+    def _open_trade_row(self, ticket: int) -> Optional[int]:
+        """Row of the ticket's open trade, None if it has none."""
+        for i in self._ticket_rows.get(ticket, ()):
+            if self.trades[i - self._trades_offset].close_price is None:
+                return i
+        return None
+    
+    @staticmethod
+    def _price_profit(trade: TradeRecord, close_price: float, volume: float) -> float:
+        """Profit of closing some volume of a trade at a price."""
+        if trade.order_type == "BUY":
+            return (close_price - trade.open_price) * volume
+        return (trade.open_price - close_price) * volume
+    
+    def _book_profit(self, i: int, trade: TradeRecord, realized_profit: float):
+        """Add realized profit to the trade at a row and to the running totals."""
+        old_profit = trade.profit
+        trade.profit += realized_profit
+        
+        self._profits[i] = trade.profit
+        self._aggregates.replace_profit(old_profit, trade.profit)
+        symbol_id, session_id = int(self._symbol_ids[i]), int(self._session_ids[i])
+        self._apply_group_profit(symbol_id, session_id, old_profit, -1)
+        self._apply_group_profit(symbol_id, session_id, trade.profit, 1)
+        
+        self._update_metrics(trade, realized_profit)
+        self._trades_version += 1
+    
+    def _update_metrics(self, trade: TradeRecord, profit: Optional[float] = None):
+        """Update performance metrics with new trade, or with profit newly realized on it."""
+        if profit is None:
+            profit = trade.profit
+        
+        # Update daily P&L
+        date_str = str(_to_datetime64(trade.open_time).astype('datetime64[D]'))
+        self.daily_pnl[date_str] += profit
+        
+        # Update session P&L
+        self.session_pnl[trade.session.value][date_str] += profit
+        
+        # Update pair P&L
+        self.pair_pnl[trade.symbol] += profit
+        
+        # Update strategy P&L
+        self.strategy_pnl[trade.strategy] += profit
+        
+        # Update balance and drawdown
+        self.current_balance += profit
+        self._push_balance(self.current_balance)
+        if self.current_balance > self.peak_balance:
+            self.peak_balance = self.current_balance
+        
+        # Calculate drawdown
+        if self.peak_balance > 0:
+            drawdown = (self.peak_balance - self.current_balance) / self.peak_balance
+            if drawdown > self.max_drawdown_pct:
+                self.max_drawdown_pct = drawdown
+                self.max_drawdown = self.peak_balance - self.current_balance
+        
+        # Update consecutive losses
+        if trade.profit < 0:
+            self.consecutive_losses += 1
+            if self.consecutive_losses > self.max_consecutive_losses:
+                self.max_consecutive_losses = self.consecutive_losses
+        else:
+            self.consecutive_losses = 0
+    
+    def _push_balance(self, balance: float):
+        """Add a balance to the rolling-peak deque, dropping entries that left the window."""
+        index = self._balance_updates
+        self._balance_updates += 1
+        
+        peaks = self._peak_deque
+        while peaks and peaks[-1][1] <= balance:
+            peaks.pop()
+        peaks.append((index, balance))
+        if peaks[0][0] <= index - self.ROLLING_DRAWDOWN_WINDOW:
+            peaks.popleft()
+    
+    def rolling_drawdown(self) -> float:
+        """Drawdown from the peak balance over the last ROLLING_DRAWDOWN_WINDOW updates."""
+        if not self._peak_deque:
+            return 0.0
+        return self._peak_deque[0][1] - self.current_balance
+    
+    def _recalculate_metrics(self):
+        """Recalculate all metrics from trade history."""
+        self.daily_pnl.clear()
+        self.session_pnl.clear()
+        self.pair_pnl.clear()
+        self.strategy_pnl.clear()
+        
+        profits = self._profits
+        self._aggregates.reset(profits, self._volumes)
+        self._group_arrays = self._group_totals()
+        self._recompute_vectorized(profits)
+        if profits.size == 0:
+            return
+        
+        # Daily P&L from day buckets of the open times
+        days, day_index = np.unique(self._open_times.astype('datetime64[D]'), return_inverse=True)
+        day_sums = np.zeros(days.size)
+        np.add.at(day_sums, day_index, profits)
+        day_strs = np.datetime_as_string(days).tolist()
+        self.daily_pnl.update(zip(day_strs, day_sums.tolist()))
+        
+        # Pair P&L straight from the interned symbol codes
+        pair_sums = np.bincount(self._symbol_ids, weights=profits, minlength=len(self._symbol_names))
+        self.pair_pnl.update(zip(self._symbol_names, pair_sums.tolist()))
+        
+        # Strategy P&L from the interned strategy codes
+        strategy_sums = np.bincount(self._strategy_ids, weights=profits, minlength=len(self._strategy_names))
+        self.strategy_pnl.update(zip(self._strategy_names, strategy_sums.tolist()))
+        
+        # Session P&L per day, grouped on a combined (session, day) code and
+        # filled in order of first appearance
+        cells = self._session_ids.astype(np.intp) * days.size + day_index
+        cell_codes, first_rows, cell_index = np.unique(cells, return_index=True, return_inverse=True)
+        cell_sums = np.bincount(cell_index, weights=profits)
+        for k in np.argsort(first_rows, kind='stable').tolist():
+            session_id, day = divmod(int(cell_codes[k]), days.size)
+            self.session_pnl[self.SESSIONS[session_id].value][day_strs[day]] = float(cell_sums[k])
+    
+    def _recompute_vectorized(self, profits: np.ndarray):
+        """Recompute balance, drawdown and losing streaks from the profit column."""
+        self.current_balance = 0.0
+        self.peak_balance = 0.0
+        self.max_drawdown = 0.0
+        self.max_drawdown_pct = 0.0
+        self.consecutive_losses = 0
+        self.max_consecutive_losses = 0
+        self._peak_deque.clear()
+        self._balance_updates = 0
+        if profits.size == 0:
+            return
+        
+        # Balance curve and drawdown (the peak starts from a zero balance)
+        balance = np.cumsum(profits)
+        
+        # Only the last window of balances can still be a rolling peak
+        window = balance[-self.ROLLING_DRAWDOWN_WINDOW:]
+        self._balance_updates = balance.size - window.size
+        for value in window.tolist():
+            self._push_balance(value)
+        peak = np.maximum(balance, 0.0)
+        np.maximum.accumulate(peak, out=peak)
+        self.current_balance = float(balance[-1])
+        self.peak_balance = float(peak[-1])
+        
+        drawdown = peak - balance
+        drawdown_pct = np.zeros_like(drawdown)
+        np.divide(drawdown, peak, out=drawdown_pct, where=peak > 0)
+        worst = int(np.argmax(drawdown_pct))
+        if drawdown_pct[worst] > 0:
+            self.max_drawdown_pct = float(drawdown_pct[worst])
+            self.max_drawdown = float(drawdown[worst])
+        
+        # Losing streaks from the run lengths of negative trades
+        losing = np.concatenate(([0], (profits < 0).view(np.int8), [0]))
+        edges = np.flatnonzero(np.diff(losing))
+        runs = edges[1::2] - edges[::2]
+        if runs.size:
+            self.max_consecutive_losses = int(runs.max())
+            if profits[-1] < 0:
+                self.consecutive_losses = int(runs[-1])
+    
+    def _cached(self, key: Tuple, compute):
+        """Return a cached result for the current trades, computing it on a miss."""
+        result = self._metrics_cache.get((self._trades_version,) + key)
+        if result is not None:
+            return result
+        
+        with self._lock:
+            versioned_key = (self._trades_version,) + key
+            if versioned_key not in self._metrics_cache:
+                if len(self._metrics_cache) >= 32:
+                    self._metrics_cache.pop(next(iter(self._metrics_cache)))
+                self._metrics_cache[versioned_key] = compute()
+            return self._metrics_cache[versioned_key]
+    
+    def get_performance_metrics(self, start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None) -> PerformanceMetrics:
+        """Calculate comprehensive performance metrics."""
+        return self._cached(('performance', start_date, end_date),
+                            lambda: self._compute_performance_metrics(start_date, end_date))
+    
+    def _date_selection(self, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """Index selecting the trades opened within a date range."""
+        open_times = self._open_times
+        if self._open_times_sorted:
+            # Trades normally arrive in open-time order, so the range is a contiguous slice
+            lo = np.searchsorted(open_times, _to_datetime64(start_date), side='left') if start_date else 0
+            hi = np.searchsorted(open_times, _to_datetime64(end_date), side='right') if end_date else open_times.size
+            return slice(int(lo), int(hi))
+        
+        mask = np.ones(open_times.size, dtype=bool)
+        if start_date:
+            mask &= open_times >= _to_datetime64(start_date)
+        if end_date:
+            mask &= open_times <= _to_datetime64(end_date)
+        return mask
+    
+    def _compute_performance_metrics(self, start_date: Optional[datetime],
+                                     end_date: Optional[datetime]) -> PerformanceMetrics:
+        """Compute performance metrics for a date range."""
+        # Filter trades by date range
+        selection = self._date_selection(start_date, end_date)
+        profits = self._profits[selection]
+        
+        if profits.size == 0:
+            return PerformanceMetrics(
+                total_trades=0, winning_trades=0, losing_trades=0,
+                win_rate=0.0, total_profit=0.0, total_loss=0.0,
+                net_profit=0.0, profit_factor=0.0, average_win=0.0,
+                average_loss=0.0, largest_win=0.0, largest_loss=0.0,
+                max_drawdown=self.max_drawdown, sharpe_ratio=0.0,
+                sortino_ratio=0.0, calmar_ratio=0.0, total_volume=0.0,
+                average_trade_duration=timedelta(0)
+            )
+        
+        # Basic and profit metrics, from the running totals when the whole history is requested
+        if start_date is None and end_date is None:
+            (total_trades, winning_trades, losing_trades, total_profit,
+             loss_sum, net_profit, total_volume) = self._aggregates.snapshot()
+        else:
+            wins = profits[profits > 0]
+            losses = profits[profits < 0]
+            total_trades = int(profits.size)
+            winning_trades = int(wins.size)
+            losing_trades = int(losses.size)
+            total_profit = float(wins.sum())
+            loss_sum = float(losses.sum())
+            net_profit = float(profits.sum())
+            total_volume = float(self._volumes[selection].sum())
+        
+        win_rate = winning_trades / total_trades
+        total_loss = abs(loss_sum)
+        profit_factor = total_profit / total_loss if total_loss > 0 else float('inf')
+        
+        # Average metrics
+        average_win = total_profit / winning_trades if winning_trades else 0.0
+        average_loss = loss_sum / losing_trades if losing_trades else 0.0
+        largest_win = float(profits.max()) if winning_trades else 0.0
+        largest_loss = float(profits.min()) if losing_trades else 0.0
+        
+        # Duration
+        durations = (self._close_times[selection] - self._open_times[selection]).astype('timedelta64[us]')
+        durations = durations[~np.isnat(durations)].astype(np.int64)
+        average_duration = timedelta(microseconds=int(durations.sum())) / durations.size if durations.size else timedelta(0)
+        
+        # Risk-adjusted metrics
+        sharpe_ratio, sortino_ratio = self._calculate_risk_ratios(profits)
+        calmar_ratio = net_profit / self.max_drawdown if self.max_drawdown > 0 else 0.0
+        
+        return PerformanceMetrics(
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            win_rate=win_rate,
+            total_profit=total_profit,
+            total_loss=total_loss,
+            net_profit=net_profit,
+            profit_factor=profit_factor,
+            average_win=average_win,
+            average_loss=average_loss,
+            largest_win=largest_win,
+            largest_loss=largest_loss,
+            max_drawdown=self.max_drawdown,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            calmar_ratio=calmar_ratio,
+            total_volume=total_volume,
+            average_trade_duration=average_duration
+        )
+    
+    def _calculate_risk_ratios(self, returns: np.ndarray,
+                               risk_free_rate: float = 0.02) -> Tuple[float, float]:
+        """Calculate annualized Sharpe and Sortino ratios in one pass over the returns."""
+        if len(returns) < 2:
+            return 0.0, 0.0
+        
+        # Subtracting the daily risk-free rate shifts every return equally, which
+        # leaves the deviations unchanged, so no excess-return array is needed
+        daily_rate = risk_free_rate / 252
+        mean = float(returns.mean()) - daily_rate
+        std = float(returns.std())
+        annualization = np.sqrt(252)
+        sharpe_ratio = mean / std * annualization if std > 0 else 0.0
+        
+        negative_returns = returns[returns < daily_rate]
+        if len(negative_returns) < 2:
+            return sharpe_ratio, 0.0
+        
+        downside_deviation = float(negative_returns.std())
+        sortino_ratio = mean / downside_deviation * annualization if downside_deviation > 0 else 0.0
+        return sharpe_ratio, sortino_ratio
+    
+    def get_session_performance(self) -> List[SessionPerformance]:
+        """Get performance metrics by session."""
+        return list(self._cached(('session',), self._compute_session_performance))
+    
+    def _group_totals(self) -> Dict[str, np.ndarray]:
+        """Per-symbol, per-session and per-(session, symbol) sums over the trade columns."""
+        n_symbols = len(self._symbol_names)
+        n_sessions = len(self.SESSIONS)
+        profits = self._profits
+        winning = profits > 0
+        win_profits = np.where(winning, profits, 0.0)
+        loss_profits = np.where(profits < 0, profits, 0.0)
+        
+        def weighted(codes: np.ndarray, weights: np.ndarray, size: int) -> np.ndarray:
+            # bincount returns integers for empty input, which would truncate later updates
+            return np.bincount(codes, weights=weights, minlength=size).astype(np.float64, copy=False)
+        
+        def grouped(codes: np.ndarray, size: int, prefix: str) -> Dict[str, np.ndarray]:
+            return {
+                prefix + 'count': np.bincount(codes, minlength=size),
+                prefix + 'wins': np.bincount(codes[winning], minlength=size),
+                prefix + 'profit': weighted(codes, profits, size),
+                prefix + 'win_sum': weighted(codes, win_profits, size),
+                prefix + 'loss_sum': weighted(codes, loss_profits, size)
+            }
+        
+        totals = grouped(self._symbol_ids, n_symbols, '')
+        totals.update(grouped(self._session_ids, n_sessions, 'session_'))
+        totals['volume'] = weighted(self._symbol_ids, self._volumes, n_symbols)
+        
+        # Session and symbol codes combined into one cell index
+        cells = self._session_ids.astype(np.intp) * n_symbols + self._symbol_ids
+        cell_shape = (n_sessions, n_symbols)
+        totals['cell_count'] = np.bincount(cells, minlength=n_sessions * n_symbols).reshape(cell_shape)
+        totals['cell_profit'] = weighted(cells, profits, n_sessions * n_symbols).reshape(cell_shape)
+        return totals
+    
+    def _add_to_group_totals(self, trade: TradeRecord):
+        """Count the newest trade row in the group totals."""
+        symbol_id = int(self._symbol_ids[-1])
+        session_id = int(self._session_ids[-1])
+        totals = self._group_arrays
+        
+        if symbol_id >= len(totals['count']):
+            # New symbol past the allocated width; grow the symbol axis geometrically
+            width = max(symbol_id + 1, 2 * len(totals['count']))
+            for name, values in totals.items():
+                if not name.startswith('session_'):
+                    padding = [(0, 0)] * (values.ndim - 1) + [(0, width - values.shape[-1])]
+                    totals[name] = np.pad(values, padding)
+        
+        totals['count'][symbol_id] += 1
+        totals['session_count'][session_id] += 1
+        totals['cell_count'][session_id, symbol_id] += 1
+        totals['volume'][symbol_id] += trade.volume
+        self._apply_group_profit(symbol_id, session_id, trade.profit, 1)
+    
+    def _apply_group_profit(self, symbol_id: int, session_id: int, profit: float, sign: int):
+        """Add (sign=1) or remove (sign=-1) a trade's profit in the group totals."""
+        totals = self._group_arrays
+        totals['cell_profit'][session_id, symbol_id] += sign * profit
+        for prefix, index in (('', symbol_id), ('session_', session_id)):
+            totals[prefix + 'profit'][index] += sign * profit
+            if profit > 0:
+                totals[prefix + 'wins'][index] += sign
+                totals[prefix + 'win_sum'][index] += sign * profit
+            elif profit < 0:
+                totals[prefix + 'loss_sum'][index] += sign * profit
+    
+    def _best_and_worst_cells(self, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Most and least profitable traded (session, symbol) cell along an axis of the cell grid."""
+        totals = self._group_arrays
+        traded = totals['cell_count'] > 0
+        best = np.where(traded, totals['cell_profit'], -np.inf).argmax(axis=axis)
+        worst = np.where(traded, totals['cell_profit'], np.inf).argmin(axis=axis)
+        return best, worst
+    
+    def _compute_session_performance(self) -> List[SessionPerformance]:
+        """Compute performance metrics by session."""
+        totals = self._group_arrays
+        session_performance = []
+        # Best and worst pair of every session in one pass over the cell grid
+        best_pairs, worst_pairs = self._best_and_worst_cells(axis=1)
+        
+        for session_id, session in enumerate(self.SESSIONS):
+            total_trades = int(totals['session_count'][session_id])
+            if total_trades == 0:
+                continue
+            
+            winning_trades = int(totals['session_wins'][session_id])
+            win_rate = winning_trades / total_trades
+            total_profit = float(totals['session_profit'][session_id])
+            average_profit = total_profit / total_trades
+            
+            # Calculate profit factor
+            session_wins = float(totals['session_win_sum'][session_id])
+            session_losses = abs(float(totals['session_loss_sum'][session_id]))
+            profit_factor = session_wins / session_losses if session_losses > 0 else float('inf')
+            
+            best_pair = self._symbol_names[best_pairs[session_id]]
+            worst_pair = self._symbol_names[worst_pairs[session_id]]
+            
+            session_performance.append(SessionPerformance(
+                session=session,
+                total_trades=total_trades,
+                winning_trades=winning_trades,
+                win_rate=win_rate,
+                total_profit=total_profit,
+                average_profit=average_profit,
+                profit_factor=profit_factor,
+                best_pair=best_pair,
+                worst_pair=worst_pair
+            ))
+        
+        return session_performance
+    
+    def get_pair_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Get performance metrics by currency pair."""
+        pair_performance = self._cached(('pair',), self._compute_pair_performance)
+        return {symbol: dict(metrics) for symbol, metrics in pair_performance.items()}
+    
+    def _compute_pair_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Compute performance metrics by currency pair."""
+        totals = self._group_arrays
+        pair_performance = {}
+        # Best and worst session of every pair in one pass over the cell grid
+        best_sessions, worst_sessions = self._best_and_worst_cells(axis=0)
+        
+        for symbol_id, symbol in enumerate(self._symbol_names):
+            total_trades = int(totals['count'][symbol_id])
+            if total_trades == 0:
+                continue
+            
+            total_profit = float(totals['profit'][symbol_id])
+            winning_trades = int(totals['wins'][symbol_id])
+            
+            # Calculate profit factor
+            wins = float(totals['win_sum'][symbol_id])
+            losses = abs(float(totals['loss_sum'][symbol_id]))
+            
+            pair_performance[symbol] = {
+                'total_trades': total_trades,
+                'winning_trades': winning_trades,
+                'total_profit': total_profit,
+                'total_volume': float(totals['volume'][symbol_id]),
+                'average_profit': total_profit / total_trades,
+                'win_rate': winning_trades / total_trades,
+                'profit_factor': wins / losses if losses > 0 else float('inf'),
+                'best_session': self.SESSIONS[best_sessions[symbol_id]].value,
+                'worst_session': self.SESSIONS[worst_sessions[symbol_id]].value
+            }
+        
+        return pair_performance
+    
+    def get_daily_pnl(self, days: int = 30) -> Dict[str, float]:
+        """Get daily P&L for the last N days."""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        
+        dates = pd.date_range(start_date.date(), end_date.date(), freq='D').strftime("%Y-%m-%d")
+        return {date_str: self.daily_pnl.get(date_str, 0.0) for date_str in dates}
+    
+    def get_risk_metrics(self) -> Dict[str, Any]:
+        """Get comprehensive risk metrics."""
+        if not self._n:
+            return {}
+        return dict(self._cached(('risk',), self._compute_risk_metrics))
+    
+    def _compute_risk_metrics(self) -> Dict[str, Any]:
+        """Compute risk metrics from the profit column."""
+        # Calculate Value at Risk
+        returns_array = self._profits
+        daily_var_95 = np.percentile(returns_array, 5) if len(returns_array) > 0 else 0.0
+        
+        # Calculate weekly VaR (assuming 5 trades per week, the last week may be partial)
+        weekly_returns = np.add.reduceat(returns_array, np.arange(0, len(returns_array), 5))
+        # np.percentile already selects with np.partition rather than a full sort; the weekly
+        # sums are a scratch array, so let it partition them in place instead of copying
+        weekly_var_95 = np.percentile(weekly_returns, 5, overwrite_input=True) if len(weekly_returns) > 0 else 0.0
+        
+        # Maximum daily loss
+        max_daily_loss = min(self.daily_pnl.values()) if self.daily_pnl else 0.0
+        
+        return {
+            'daily_var_95': daily_var_95,
+            'weekly_var_95': weekly_var_95,
+            'max_daily_loss': max_daily_loss,
+            'max_drawdown': self.max_drawdown,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'max_consecutive_losses': self.max_consecutive_losses,
+            'current_consecutive_losses': self.consecutive_losses,
+            'total_trades': self._n,
+            'current_balance': self.current_balance,
+            'peak_balance': self.peak_balance
+        }
+    
+    def generate_report(self, report_type: str = "comprehensive") -> Dict[str, Any]:
+        """Generate a comprehensive trading report."""
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'report_type': report_type,
+            'summary': {},
+            'performance': {},
+            'risk_metrics': {},
+            'session_analysis': {},
+            'pair_analysis': {},
+            'recommendations': []
+        }
+        
+        # Read every section from the same trades version; a trade landing mid-report
+        # would otherwise mix old and new figures
+        with self._lock:
+            metrics = self.get_performance_metrics()
+            risk_metrics = self.get_risk_metrics()
+            session_perf = self.get_session_performance()
+            pair_perf = self.get_pair_performance()
+        
+        # Overall performance
+        report['performance'] = metrics.to_dict()
+        
+        # Risk metrics
+        report['risk_metrics'] = risk_metrics
+        
+        # Session analysis
+        report['session_analysis'] = [sp.to_dict() for sp in session_perf]
+        
+        # Pair analysis
+        report['pair_analysis'] = pair_perf
+        
+        # Summary
+        report['summary'] = {
+            'total_trades': metrics.total_trades,
+            'net_profit': metrics.net_profit,
+            'win_rate': metrics.win_rate,
+            'profit_factor': metrics.profit_factor,
+            'max_drawdown': self.max_drawdown,
+            'sharpe_ratio': metrics.sharpe_ratio
+        }
+        
+        # Generate recommendations
+        recommendations = []
+        
+        if metrics.win_rate < 0.4:
+            recommendations.append("Consider reviewing strategy parameters - low win rate detected")
+        
+        if metrics.profit_factor < 1.2:
+            recommendations.append("Profit factor below optimal level - review risk management")
+        
+        if self.max_drawdown_pct > 0.2:
+            recommendations.append("High drawdown detected - consider reducing position sizes")
+        
+        # Find best performing session
+        if session_perf:
+            best_session = max(session_perf, key=lambda x: x.total_profit)
+            recommendations.append(f"Best performing session: {best_session.session.value}")
+        
+        # Find best performing pair
+        if pair_perf:
+            best_pair = max(pair_perf.items(), key=lambda x: x[1]['total_profit'])
+            recommendations.append(f"Best performing pair: {best_pair[0]}")
+        
+        report['recommendations'] = recommendations
+        
+        return report
+    
+    def save_report(self, report: Dict[str, Any], filename: Optional[str] = None):
+        """Save report to file."""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"trading_report_{timestamp}.json"
+        
+        report_file = self.data_dir / filename
+        
+        try:
+            try:
+                payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            except orjson.JSONEncodeError:
+                # Types orjson refuses (e.g. integers beyond 64 bits) go through the stdlib encoder
+                payload = json.dumps(report, indent=2).encode()
+            
+            report_file.write_bytes(payload)
+            
+            logger.info(f"Trading report saved to {report_file}")
+            
+        except Exception as e:
+            logger.error(f"Error saving report: {e}")
+    
+    def _today(self) -> str:
+        """Today's date as YYYY-MM-DD, reformatted only when the local day rolls over."""
+        now = time.time()
+        if now >= self._today_expires:
+            today = date.fromtimestamp(now)
+            self._today_str = today.isoformat()
+            self._today_expires = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return self._today_str
+    
+    def get_realtime_status(self) -> Dict[str, Any]:
+        """Get real-time trading status."""
+        if not self._n:
+            return {
+                'status': 'No trades yet',
+                'current_balance': 0.0,
+                'total_trades': 0,
+                'today_pnl': 0.0
+            }
+        
+        # Today's P&L
+        today_pnl = self.daily_pnl.get(self._today(), 0.0)
+        
+        # Recent trades
+        recent_trades = heapq.nlargest(5, self.trades, key=lambda x: x.open_time)
+        
+        return {
+            'status': 'Active',
+            'current_balance': self.current_balance,
+            'peak_balance': self.peak_balance,
+            'total_trades': self._n,
+            'today_pnl': today_pnl,
+            'max_drawdown': self.max_drawdown,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'consecutive_losses': self.consecutive_losses,
+            'recent_trades': [
+                {
+                    'symbol': t.symbol,
+                    'type': t.order_type,
+                    'profit': t.profit,
+                    'time': t.open_time.strftime("%H:%M:%S")
+                }
+                for t in recent_trades
+            ]
         } 
\ No newline at end of file
@@ -0,0 +1,178 @@
+/*
+ * Browser-side renderers for the Market Session Trading Bot dashboard.
+ *
+ * The server collects the bot data once per refresh into the bot-data-store
+ * component (see TradingDashboard.update_store); these functions turn it into
+ * the text and coloured spans of the status, metrics and multi-currency panels.
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        renderStatus: function(data) {
+            if (!data) {
+                return window.dash_clientside.no_update;
+            }
+            if (!data.available) {
+                return ['Not Connected', 'Disconnected', 'N/A', 'N/A'];
+            }
+            var status = data.status;
+            if (!status) {
+                return ['Error', 'Error', 'Error', 'Error'];
+            }
+            
+            return [
+                span(status.running ? 'Running' : 'Stopped', status.running ? 'green' : 'red'),
+                span(status.connected ? 'Connected' : 'Disconnected', status.connected ? 'green' : 'red'),
+                span('$' + status.daily_pnl.toFixed(2), status.daily_pnl >= 0 ? 'green' : 'red'),
+                span(String(status.open_positions))
+            ];
+        },
+        
+        renderMetrics: function(data) {
+            if (!data) {
+                return window.dash_clientside.no_update;
+            }
+            if (!data.available) {
+                return ['No data available', 'No data available'];
+            }
+            if (!data.metrics) {
+                return ['Error loading metrics', 'Error loading metrics'];
+            }
+            
+            return [
+                formatPerformanceMetrics(data.metrics.performance),
+                formatRiskMetrics(data.metrics.risk)
+            ];
+        },
+        
+        renderMultiCurrency: function(data) {
+            if (!data) {
+                return window.dash_clientside.no_update;
+            }
+            if (!data.available) {
+                return ['No data available', 'No data available'];
+            }
+            if (!data.multi_currency) {
+                return ['Error loading data', 'Error loading data'];
+            }
+            
+            return [
+                formatPairPerformance(data.multi_currency.pairs),
+                formatCorrelationMatrix(data.multi_currency.correlation)
+            ];
+        }
+    }
+});
+
+function span(text, color) {
+    var props = {children: text};
+    if (color) {
+        props.style = {color: color};
+    }
+    return {namespace: 'dash_html_components', type: 'Span', props: props};
+}
+
+// A number with fixed decimals and optional units (scale, prefix, suffix); the server
+// sends infinite values as 'inf' / '-inf', anything else non-numeric shows as N/A
+function fixed(value, digits, units) {
+    units = units || {};
+    if (value === 'inf') {
+        return '∞';
+    }
+    if (value === '-inf') {
+        return '-∞';
+    }
+    if (typeof value !== 'number' || !Number.isFinite(value)) {
+        return 'N/A';
+    }
+    return (units.prefix || '') + (value * (units.scale || 1)).toFixed(digits) + (units.suffix || '');
+}
+
+function formatPerformanceMetrics(metrics) {
+    try {
+        var lines = [];
+        
+        if ('total_trades' in metrics) {
+            lines.push('Total Trades: ' + metrics.total_trades);
+        }
+        if ('win_rate' in metrics) {
+            lines.push('Win Rate: ' + fixed(metrics.win_rate, 1, {scale: 100, suffix: '%'}));
+        }
+        if ('profit_factor' in metrics) {
+            lines.push('Profit Factor: ' + fixed(metrics.profit_factor, 2));
+        }
+        if ('total_profit' in metrics) {
+            lines.push('Total Profit: ' + fixed(metrics.total_profit, 2, {prefix: '$'}));
+        }
+        if ('sharpe_ratio' in metrics) {
+            lines.push('Sharpe Ratio: ' + fixed(metrics.sharpe_ratio, 2));
+        }
+        
+        return lines.length ? lines.join('\n') : 'No performance data';
+    } catch (e) {
+        return 'Error formatting metrics';
+    }
+}
+
+function formatRiskMetrics(riskData) {
+    try {
+        var lines = [];
+        
+        if ('current_drawdown' in riskData) {
+            lines.push('Current Drawdown: ' + fixed(riskData.current_drawdown, 2, {suffix: '%'}));
+        }
+        if ('max_drawdown' in riskData) {
+            lines.push('Max Drawdown: ' + fixed(riskData.max_drawdown, 2, {suffix: '%'}));
+        }
+        if ('var_95' in riskData) {
+            lines.push('VaR (95%): ' + fixed(riskData.var_95, 2, {prefix: '$'}));
+        }
+        if ('open_positions' in riskData) {
+            lines.push('Open Positions: ' + riskData.open_positions);
+        }
+        
+        return lines.length ? lines.join('\n') : 'No risk data';
+    } catch (e) {
+        return 'Error formatting metrics';
+    }
+}
+
+function formatPairPerformance(pairData) {
+    try {
+        var lines = Object.keys(pairData).map(function(pair) {
+            var data = pairData[pair];
+            return pair + ': ' + data.trades + ' trades, $' + data.profit.toFixed(2) + ' profit, ' +
+                (data.win_rate * 100).toFixed(1) + '% win rate';
+        });
+        
+        return lines.length ? lines.join('\n') : 'No pair data available';
+    } catch (e) {
+        return 'Error formatting data';
+    }
+}
+
+function formatCorrelationMatrix(correlation) {
+    try {
+        var pairs = correlation.pairs;
+        if (!pairs.length) {
+            return 'No correlation data available';
+        }
+        
+        // Header
+        var header = 'Pair'.padEnd(10) + pairs.map(function(pair) {
+            return pair.padStart(8);
+        }).join('');
+        var lines = [header, '-'.repeat(header.length)];
+        
+        // Matrix rows; the server fills the diagonal and missing cells
+        correlation.values.forEach(function(row, i) {
+            lines.push(pairs[i].padEnd(10) + row.map(function(value) {
+                return value.toFixed(3).padStart(8);
+            }).join(''));
+        });
+        
+        return lines.join('\n');
+    } catch (e) {
+        return 'Error formatting matrix';
+    }
+}
@@ -1,9 +1,9 @@
-"""
-Utility functions for the Market Session Trading Bot.
-"""
-
-from .helpers import *
-from .validators import *
-from .formatters import *
-
+"""
+Utility functions for the Market Session Trading Bot.
+"""
+
+from .helpers import *
+from .validators import *
+from .formatters import *
+
 __all__ = ['format_currency', 'validate_config', 'calculate_pip_value', 'format_time'] 
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test Correlation Window
+
+This test file validates that the rolling correlation window kept by the
+currency manager matches a full recompute over the same bars.
+"""
+
+import sys
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.currency_manager import CurrencyManager
+
+class TestCorrelationWindow(unittest.TestCase):
+    """Test cases for the rolling correlation window."""
+    
+    SYMBOLS = ['EURUSD', 'GBPUSD', 'USDJPY', 'AUDUSD']
+    WINDOW_BARS = 101
+    
+    def setUp(self):
+        """Create correlated H1 closes for a few pairs."""
+        rng = np.random.default_rng(42)
+        bars = 600
+        common = rng.normal(size=(bars, 1))
+        returns = 0.001 * (common + rng.normal(size=(bars, len(self.SYMBOLS))))
+        closes = np.exp(np.cumsum(returns, axis=0))
+        index = pd.date_range('2024-01-01', periods=bars, freq='h')
+        self.price_data = {
+            symbol: pd.DataFrame({'close': closes[:, i]}, index=index)
+            for i, symbol in enumerate(self.SYMBOLS)
+        }
+    
+    def _bars(self, start, end):
+        """Price data for bar positions start to end."""
+        return {symbol: data.iloc[start:end] for symbol, data in self.price_data.items()}
+    
+    def _assert_matches_recompute(self, manager, end):
+        """Check the window's correlations against a fresh matrix of the same bars."""
+        expected = CurrencyManager()
+        expected.update_correlation_matrix(self._bars(end - self.WINDOW_BARS, end))
+        
+        self.assertEqual(manager.correlation_last_bar, expected.correlation_last_bar)
+        np.testing.assert_allclose(manager.correlation_matrix.loc[self.SYMBOLS, self.SYMBOLS].to_numpy(),
+                                   expected.correlation_matrix.loc[self.SYMBOLS, self.SYMBOLS].to_numpy(),
+                                   atol=1e-5)
+    
+    def test_window_matches_full_recompute(self):
+        """Test that sliding the window bar batch by bar batch matches a full recompute."""
+        manager = CurrencyManager()
+        manager.update_correlation_matrix(self._bars(0, self.WINDOW_BARS))
+        
+        end = self.WINDOW_BARS
+        for step in [1, 3, 1, 24, 7, 100, 150, 2]:
+            # Each fetch starts a day before the last bar, as the bot's does
+            added = manager.append_bars(self._bars(end - 24, end + step))
+            end += step
+            
+            self.assertEqual(added, step)
+            self._assert_matches_recompute(manager, end)
+    
+    def test_already_folded_bars_are_skipped(self):
+        """Test that re-sent bars do not slide the window again."""
+        manager = CurrencyManager()
+        manager.update_correlation_matrix(self._bars(0, self.WINDOW_BARS))
+        
+        self.assertEqual(manager.append_bars(self._bars(0, self.WINDOW_BARS)), 0)
+        self.assertEqual(manager.append_bars(self._bars(self.WINDOW_BARS - 24, self.WINDOW_BARS + 5)), 5)
+        self.assertEqual(manager.append_bars(self._bars(self.WINDOW_BARS - 24, self.WINDOW_BARS + 5)), 0)
+        self._assert_matches_recompute(manager, self.WINDOW_BARS + 5)
+
+def run_correlation_window_tests():
+    """Run all correlation window tests."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCorrelationWindow)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
+    success = run_correlation_window_tests()
+    sys.exit(0 if success else 1)
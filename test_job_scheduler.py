@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test Job Scheduler
+
+This test file validates the trading bot's main loop scheduler: jobs run in
+due order, cancelled or replaced jobs never run, and stop() wakes the loop.
+"""
+
+import sys
+import os
+import time
+import unittest
+from threading import Thread, Event, Condition
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+try:
+    from src.core.trading_bot import TradingBot
+except ImportError:  # MetaTrader5 is only available on Windows
+    TradingBot = None
+
+@unittest.skipIf(TradingBot is None, "trading bot dependencies are not installed")
+class TestJobScheduler(unittest.TestCase):
+    """Test cases for the main loop's job scheduling."""
+    
+    def setUp(self):
+        """Create a bot with only the scheduler state and a recorder for job runs."""
+        self.bot = TradingBot.__new__(TradingBot)
+        self.bot.running = True
+        self.bot.stop_event = Event()
+        self.bot._jobs = []
+        self.bot._job_seq = 0
+        self.bot._live_jobs = {}
+        self.bot._job_wakeup = Condition()
+        self.bot.session_manager = Mock()
+        self.bot.broker = Mock()
+        
+        # The loop's own jobs: risk updates run once at start, then stay out of the way
+        self.bot.risk_update_interval = 3600
+        self.bot.profit_check_interval = 3600
+        self.bot._update_risk_management = self._recorder("risk_update")
+        self.bot._check_profit_taking = self._recorder("profit_check")
+        
+        self.runs = []
+        self.loop = Thread(target=self.bot._main_loop, daemon=True)
+    
+    def tearDown(self):
+        """Stop the loop if a test left it running."""
+        if self.bot.running:
+            self.bot.stop()
+        if self.loop.is_alive():
+            self.loop.join(timeout=1)
+    
+    def _recorder(self, name, done=None):
+        """Callback appending its name to the runs, setting an event when given one."""
+        def callback():
+            self.runs.append(name)
+            if done is not None:
+                done.set()
+        return callback
+    
+    def test_jobs_fire_in_due_order(self):
+        """Test that overdue jobs run oldest first, ahead of the loop's own jobs."""
+        done = Event()
+        self.bot._schedule_job("third", 3600, self._recorder("third", done), delay=-0.1)
+        self.bot._schedule_job("first", 3600, self._recorder("first"), delay=-0.3)
+        self.bot._schedule_job("second", 3600, self._recorder("second"), delay=-0.2)
+        
+        self.loop.start()
+        self.assertTrue(done.wait(timeout=1))
+        self.assertEqual(self.runs[:3], ["first", "second", "third"])
+    
+    def test_jobs_fire_at_their_interval(self):
+        """Test that a shorter interval runs first and more often."""
+        self.loop.start()
+        self.bot._schedule_job("slow", 0.1, self._recorder("slow"))
+        self.bot._schedule_job("fast", 0.02, self._recorder("fast"))
+        time.sleep(0.35)
+        self.bot.stop()
+        self.loop.join(timeout=1)
+        
+        runs = [name for name in self.runs if name in ("fast", "slow")]
+        self.assertEqual(runs[0], "fast")
+        self.assertGreater(runs.count("fast"), 2 * runs.count("slow"))
+        self.assertGreaterEqual(runs.count("slow"), 2)
+    
+    def test_cancelled_job_never_runs(self):
+        """Test that a job cancelled before it is due never runs."""
+        self.loop.start()
+        self.bot._schedule_job("cancelled", 3600, self._recorder("cancelled"), delay=0.05)
+        self.bot._cancel_job("cancelled")
+        time.sleep(0.15)
+        
+        self.assertNotIn("cancelled", self.runs)
+        self.assertNotIn("cancelled", self.bot._live_jobs)
+    
+    def test_reschedule_replaces_job(self):
+        """Test that scheduling under a taken name replaces the earlier job."""
+        done = Event()
+        self.loop.start()
+        self.bot._schedule_job("analysis", 3600, self._recorder("old"), delay=0.02)
+        self.bot._schedule_job("analysis", 3600, self._recorder("new", done), delay=0.04)
+        
+        self.assertTrue(done.wait(timeout=1))
+        time.sleep(0.05)
+        self.assertEqual([name for name in self.runs if name in ("old", "new")], ["new"])
+    
+    def test_stop_wakes_waiting_loop(self):
+        """Test that stop() ends a loop sleeping until a distant job."""
+        self.loop.start()
+        time.sleep(0.05)
+        self.assertEqual(self.runs, ["risk_update"])
+        
+        started = time.monotonic()
+        self.bot.stop()
+        self.loop.join(timeout=1)
+        
+        self.assertFalse(self.loop.is_alive())
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.bot.broker.disconnect.assert_called_once()
+
+def run_scheduler_tests():
+    """Run all job scheduler tests."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestJobScheduler)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
+    success = run_scheduler_tests()
+    sys.exit(0 if success else 1)
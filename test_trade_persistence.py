@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test Trade Persistence
+
+This test file validates that the profit monitor's trade history survives a
+restart, whether it is held in the journal, the snapshot or the monthly archives.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.profit_monitor import ProfitMonitor, TradeRecord
+from src.core.session_manager import SessionType
+
+class TestTradePersistence(unittest.TestCase):
+    """Test cases for the trade journal, snapshot and archives."""
+    
+    def setUp(self):
+        """Set up an empty data directory."""
+        self.data_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Remove the data directory."""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+    
+    def _create_monitor(self, max_hot_trades=10_000, snapshot_interval=1000):
+        """Create a profit monitor with its own archive and snapshot thresholds."""
+        monitor = ProfitMonitor(self.data_dir)
+        monitor.MAX_HOT_TRADES = max_hot_trades
+        monitor.SNAPSHOT_INTERVAL = snapshot_interval
+        return monitor
+    
+    def _trade_history(self, monitor):
+        """Every trade the monitor knows about, archived ones first."""
+        return monitor.load_archived_trades() + list(monitor.trades)
+    
+    def _add_trades(self, monitor, count, open_count=0):
+        """Add trades spread over several months, leaving the last open_count open."""
+        start = datetime(2024, 1, 1)
+        for ticket in range(count):
+            open_time = start + timedelta(days=ticket * 3)
+            monitor.add_trade(TradeRecord(
+                ticket=ticket,
+                symbol='EURUSD' if ticket % 2 else 'GBPUSD',
+                order_type='BUY' if ticket % 3 else 'SELL',
+                volume=0.1,
+                open_price=1.1000,
+                close_price=None,
+                open_time=open_time,
+                close_time=None,
+                profit=0.0,
+                swap=0.0,
+                commission=0.0,
+                session=SessionType.LONDON if ticket % 2 else SessionType.NEW_YORK,
+                strategy='TestStrategy',
+                stop_loss=None,
+                take_profit=None,
+                exit_reason=None
+            ))
+            if ticket < count - open_count:
+                monitor.close_trade(ticket, 1.1000 + (ticket % 7 - 3) * 0.001,
+                                    open_time + timedelta(hours=4), 'take_profit')
+    
+    def _assert_reloaded(self, monitor):
+        """Check that a fresh monitor on the same directory sees the same history."""
+        reloaded = ProfitMonitor(self.data_dir)
+        history = self._trade_history(reloaded)
+        self.assertEqual(history, self._trade_history(monitor))
+        self.assertEqual(len({trade.ticket for trade in history}), len(history))
+        self._assert_metrics_equal(reloaded, monitor)
+        return reloaded
+    
+    def _assert_metrics_equal(self, reloaded, monitor):
+        """Check the metrics match, up to the order the profits were summed in."""
+        expected = asdict(monitor.get_performance_metrics())
+        for name, value in asdict(reloaded.get_performance_metrics()).items():
+            if isinstance(value, float):
+                self.assertAlmostEqual(value, expected[name], places=9, msg=name)
+            else:
+                self.assertEqual(value, expected[name], name)
+        
+        expected = monitor.get_pair_performance()
+        pair_performance = reloaded.get_pair_performance()
+        self.assertEqual(pair_performance.keys(), expected.keys())
+        for symbol, metrics in pair_performance.items():
+            for name, value in metrics.items():
+                self.assertAlmostEqual(value, expected[symbol][name], places=9, msg=f"{symbol} {name}")
+    
+    def test_reload_from_journal(self):
+        """Test reloading trades written only to the journal."""
+        monitor = self._create_monitor()
+        self._add_trades(monitor, 20, open_count=2)
+        
+        self.assertFalse((Path(self.data_dir) / "trades.json").exists())
+        reloaded = self._assert_reloaded(monitor)
+        self.assertEqual(len(reloaded.trades), 20)
+        self.assertIsNone(reloaded.trades[-1].close_price)
+    
+    def test_reload_after_snapshot(self):
+        """Test reloading from a snapshot plus the journal written since."""
+        monitor = self._create_monitor(snapshot_interval=15)
+        self._add_trades(monitor, 20, open_count=2)
+        
+        self.assertTrue((Path(self.data_dir) / "trades.json").exists())
+        self.assertGreater(monitor._journal_entries, 0)
+        reloaded = self._assert_reloaded(monitor)
+        self.assertEqual(len(reloaded.trades), 20)
+    
+    def test_reload_with_archives(self):
+        """Test reloading when closed trades were moved to the monthly archives."""
+        monitor = self._create_monitor(max_hot_trades=5, snapshot_interval=10)
+        self._add_trades(monitor, 40, open_count=2)
+        
+        archives = sorted(Path(self.data_dir).glob("trades_*.ndjson"))
+        self.assertGreater(len(archives), 1)
+        reloaded = self._assert_reloaded(monitor)
+        self.assertEqual(len(self._trade_history(reloaded)), 40)
+        self.assertLess(len(reloaded.trades), 40)
+    
+    def test_crash_between_archive_and_snapshot(self):
+        """Test that trades archived but still in the snapshot are not loaded twice."""
+        monitor = self._create_monitor(max_hot_trades=5, snapshot_interval=10_000)
+        self._add_trades(monitor, 30, open_count=2)
+        monitor._save_data()
+        monitor.MAX_HOT_TRADES = 1
+        
+        # Archive without the snapshot that would normally follow
+        history = self._trade_history(monitor)
+        monitor._archive_cold_trades()
+        
+        reloaded = ProfitMonitor(self.data_dir)
+        self.assertEqual(self._trade_history(reloaded), history)
+        self._assert_metrics_equal(reloaded, monitor)
+    
+    def test_failed_archive_write_is_rolled_back(self):
+        """Test that a failed archive write leaves no partial archive behind."""
+        monitor = self._create_monitor(max_hot_trades=5, snapshot_interval=10_000)
+        self._add_trades(monitor, 30, open_count=2)
+        
+        # A directory in place of the second month's archive makes its append fail
+        # after the first month has been written
+        blocked = Path(self.data_dir) / "trades_202402.ndjson"
+        blocked.mkdir()
+        monitor._save_data()
+        blocked.rmdir()
+        
+        self.assertEqual(len(monitor.trades), 30)
+        self.assertEqual(monitor.load_archived_trades(), [])
+        
+        monitor._save_data()
+        self.assertEqual(len(monitor.load_archived_trades()), 25)
+        self._assert_reloaded(monitor)
+
+def run_persistence_tests():
+    """Run all trade persistence tests."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTradePersistence)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+if __name__ == "__main__":
+    success = run_persistence_tests()
+    sys.exit(0 if success else 1)